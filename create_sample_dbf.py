@@ -5,171 +5,463 @@ Sample DBF Creator for EDVAN DBF Commander
 
 This script creates sample DBF files for testing the application.
 Run this script to create test files before running the main application.
+Use --size N to generate N synthetic records per table for stress testing.
 """
 
+import argparse
 import os
+import random
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple
+import numpy as np
 
-try:
-    import dbf
-except ImportError:
-    print("Error: dbf library not installed.")
-    print("Please install it with: pip install dbf")
-    exit(1)
 
+# Sample record types; NamedTuple keeps them slot-based, immutable and
+# still plain tuples for the writer
+class Employee(NamedTuple):
+    emp_id: int
+    name: str
+    department: str
+    salary: float
+    hire_date: date
+    active: bool
 
-def create_employees_dbf():
-    """Create a sample employees DBF file"""
+
+class Product(NamedTuple):
+    prod_id: str
+    prod_name: str
+    category: str
+    price: float
+    in_stock: int
+    descrip: str
+
+
+class Sale(NamedTuple):
+    sale_id: int
+    customer: str
+    prod_id: str
+    quantity: int
+    unit_price: float
+    sale_date: date
+    total_amt: float = 0.0
+
+
+# Table structures as (name, type, length, decimals) field layouts
+EMPLOYEE_FIELDS = (
+    ('emp_id', 'N', 6, 0),
+    ('name', 'C', 30, 0),
+    ('department', 'C', 20, 0),
+    ('salary', 'N', 10, 2),
+    ('hire_date', 'D', 8, 0),
+    ('active', 'L', 1, 0),
+)
+
+PRODUCT_FIELDS = (
+    ('prod_id', 'C', 10, 0),
+    ('prod_name', 'C', 50, 0),
+    ('category', 'C', 20, 0),
+    ('price', 'N', 8, 2),
+    ('in_stock', 'N', 6, 0),
+    ('descrip', 'M', 10, 0),
+)
+
+SALE_FIELDS = (
+    ('sale_id', 'N', 8, 0),
+    ('customer', 'C', 40, 0),
+    ('prod_id', 'C', 10, 0),
+    ('quantity', 'N', 4, 0),
+    ('unit_price', 'N', 8, 2),
+    ('sale_date', 'D', 8, 0),
+    ('total_amt', 'N', 10, 2),
+)
+
+
+# dBase III file header, field descriptor and record markers
+DBF3_HEADER = struct.Struct('<BBBBLHH20x')
+DBF3_FIELD = struct.Struct('<11scLBB14x')
+HEADER_TERMINATOR = b'\r'
+END_OF_FILE = b'\x1a'
+# The header declares no code page (language driver 0, as the dbf library
+# writes by default), so text is stored as plain ASCII. That is also
+# CPython's fastest codec; anything outside it is replaced with '?'.
+CODEPAGE = 'ascii'
+
+# Rows encoded per batch, which bounds memory for generated tables
+CHUNK_ROWS = 10000
+
+# emp_id is N(6,0), so generated tables stop at 999,999 rows
+MAX_GENERATED_ROWS = 999999
+
+DEPARTMENTS = ('Engineering', 'Marketing', 'HR', 'Finance')
+CATEGORIES = ('Electronics', 'Furniture', 'Books')
+
+# dBase III memo (.dbt) file layout
+DBT_BLOCK_SIZE = 512
+DBT_HEADER = struct.Struct('<L508x')
+MEMO_TERMINATOR = b'\x1a\x1a'
+
+
+@lru_cache(maxsize=None)
+def _record_struct(fields):
+    """Build the fixed-width record struct (deletion flag + fields) for a layout"""
+    return struct.Struct('1s' + ''.join(f"{length}s" for _, _, length, _ in fields))
+
+
+_DATE_CACHE = {}
+
+
+def _encode_date(value):
+    """Encode a date as YYYYMMDD bytes, reusing the result for repeated dates"""
+    encoded = _DATE_CACHE.get(value)
+    if encoded is None:
+        encoded = b'%04d%02d%02d' % (value.year, value.month, value.day)
+        _DATE_CACHE[value] = encoded
+    return encoded
+
+
+def _encode_text_column(column, length):
+    """Truncate, pad and encode a whole character column in one NumPy pass"""
+    values = np.array(column, dtype=f'U{length}')
+    return np.char.encode(np.char.ljust(values, length), CODEPAGE, 'replace').tolist()
+
+
+def _make_encoder(field_type, length, decimals):
+    """Return a function encoding one value as a fixed-width field of the given type"""
+    if field_type == 'N':
+        number_format = f"{{:{length}.{decimals}f}}"
+        
+        def encode(value):
+            encoded = number_format.format(value).encode('ascii')
+            if len(encoded) > length:
+                raise ValueError(f"Value {value} does not fit in N({length},{decimals})")
+            return encoded
+    elif field_type == 'D':
+        encode = _encode_date
+    elif field_type == 'L':
+        def encode(value):
+            return b'T' if value else b'F'
+    else:
+        raise ValueError(f"Unsupported field type: {field_type}")
+    return encode
+
+
+def _make_column_encoder(field_type, length, decimals):
+    """Return a function encoding a whole column as fixed-width fields of the given type"""
+    if field_type == 'M':
+        # Memo pointers depend on the .dbt being built, see _encode_memo_column()
+        return None
+    if field_type == 'C':
+        return partial(_encode_text_column, length=length)
     
-    # Define the table structure
-    table = dbf.Table(
-        'sample_employees.dbf',
-        'emp_id N(6,0); name C(30); department C(20); salary N(10,2); hire_date D; active L'
-    )
+    encode = _make_encoder(field_type, length, decimals)
+    return lambda column: list(map(encode, column))
+
+
+@lru_cache(maxsize=None)
+def _field_encoders(fields):
+    """Build the per-field column encoders for a layout once, so rows skip type dispatch"""
+    return tuple(_make_column_encoder(field_type, length, decimals)
+                 for _, field_type, length, decimals in fields)
+
+
+def _encode_memo_column(column, memo_data):
+    """
+    Encode a memo column as .dbt block pointers.
     
-    # Open the table for writing
-    table.open(mode=dbf.READ_WRITE)
+    Each non-empty memo is appended to memo_data, padded to whole blocks, so
+    block numbers keep counting across several memo columns. Block 0 is the
+    .dbt header.
+    """
+    encoded = []
+    for text in column:
+        if not text:
+            encoded.append(b' ' * 10)
+            continue
+        encoded.append(b'%10d' % (1 + len(memo_data) // DBT_BLOCK_SIZE))
+        data = str(text).encode(CODEPAGE, errors='replace') + MEMO_TERMINATOR
+        padded_length = -(-len(data) // DBT_BLOCK_SIZE) * DBT_BLOCK_SIZE
+        memo_data += data.ljust(padded_length, b'\0')
+    return encoded
+
+
+def _build_header(fields, record_count, has_memo=False):
+    """Build the dBase III header and field descriptors for a layout"""
+    record = _record_struct(fields)
+    header_length = DBF3_HEADER.size + DBF3_FIELD.size * len(fields) + len(HEADER_TERMINATOR)
+    version = 0x83 if has_memo else 0x03
+    today = date.today()
     
-    # Sample data
-    employees = [
-        (1, 'John Smith', 'Engineering', 75000.00, date(2020, 1, 15), True),
-        (2, 'Sarah Johnson', 'Marketing', 65000.50, date(2019, 6, 10), True),
-        (3, 'Michael Brown', 'Engineering', 82000.00, date(2018, 3, 22), True),
-        (4, 'Emily Davis', 'HR', 58000.75, date(2021, 9, 5), True),
-        (5, 'Robert Wilson', 'Finance', 70000.00, date(2017, 12, 1), True),
-        (6, 'Lisa Anderson', 'Marketing', 67000.25, date(2020, 8, 18), False),
-        (7, 'David Taylor', 'Engineering', 79000.00, date(2019, 2, 14), True),
-        (8, 'Jennifer White', 'HR', 62000.00, date(2022, 4, 7), True),
-        (9, 'Christopher Lee', 'Finance', 71500.50, date(2018, 11, 30), True),
-        (10, 'Amanda Martinez', 'Engineering', 83000.00, date(2017, 5, 25), True),
-        (11, 'James Garcia', 'Marketing', 66000.00, date(2021, 1, 12), True),
-        (12, 'Michelle Rodriguez', 'Engineering', 77000.75, date(2020, 7, 3), True),
-        (13, 'Thomas Hernandez', 'Finance', 69000.00, date(2019, 10, 8), False),
-        (14, 'Jessica Lopez', 'HR', 61000.25, date(2021, 3, 20), True),
-        (15, 'Daniel Gonzalez', 'Marketing', 68000.50, date(2018, 8, 16), True),
-    ]
+    parts = [DBF3_HEADER.pack(version, today.year - 1900, today.month, today.day,
+                              record_count, header_length, record.size)]
+    offset = 1  # Skip the deletion flag
+    for name, field_type, length, decimals in fields:
+        parts.append(DBF3_FIELD.pack(name.upper().encode('ascii'), field_type.encode('ascii'),
+                                     offset, length, decimals))
+        offset += length
+    parts.append(HEADER_TERMINATOR)
+    return b''.join(parts)
+
+
+def _chunked(rows, size):
+    """Yield lists of up to size rows from any iterable, without materializing it"""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_dbf3(file_path, fields, rows):
+    """
+    Write a dBase III table without going through the dbf library.
     
-    # Add records to the table
-    for emp_data in employees:
-        table.append(emp_data)
+    Rows may be any iterable, including a generator; they are consumed in
+    chunks. Each chunk is encoded column by column and packed with one
+    precomputed struct straight into the file image, which is written with
+    a single call once the record count is known. Memo fields are stored
+    in a .dbt file next to the table. Returns the number of records written.
+    """
+    record = _record_struct(fields)
+    encoders = _field_encoders(fields)
+    has_memo = any(field_type == 'M' for _, field_type, _, _ in fields)
+    header_length = DBF3_HEADER.size + DBF3_FIELD.size * len(fields) + len(HEADER_TERMINATOR)
+    memo_data = bytearray()
     
-    # Close the table
-    table.close()
+    # Reserve room for the header; it is filled in once all records are counted
+    image = bytearray(header_length)
+    pack_into = record.pack_into
+    for chunk in _chunked(rows, CHUNK_ROWS):
+        # Transpose the chunk into columns and encode one column at a time
+        encoded_columns = [
+            _encode_memo_column(column, memo_data) if encode_column is None else encode_column(column)
+            for encode_column, column in zip(encoders, zip(*chunk))
+        ]
+        
+        # Pack the chunk's records straight into the space added for them
+        offset = len(image)
+        image += bytes(len(chunk) * record.size)
+        for values in zip(*encoded_columns):
+            pack_into(image, offset, b' ', *values)
+            offset += record.size
+    
+    record_count = (len(image) - header_length) // record.size
+    image[:header_length] = _build_header(fields, record_count, has_memo)
+    image += END_OF_FILE
+    Path(file_path).write_bytes(image)
     
-    print(f"Created sample_employees.dbf with {len(employees)} records")
+    if has_memo:
+        next_block = 1 + len(memo_data) // DBT_BLOCK_SIZE
+        memo_data[:0] = DBT_HEADER.pack(next_block)
+        Path(file_path).with_suffix('.dbt').write_bytes(memo_data)
+    
+    return record_count
+
+
+def _create_dbf(file_path, fields, rows):
+    """Create a DBF file from a field layout and rows, returning a status message"""
+    record_count = write_dbf3(file_path, fields, rows)
+    return f"Created {os.path.basename(file_path)} with {record_count:,} records"
+
+
+def _with_sale_totals(sales):
+    """Fill in total_amt (quantity * unit_price) for each sale, one vector op per chunk"""
+    for chunk in _chunked(sales, CHUNK_ROWS):
+        quantities = np.array([sale.quantity for sale in chunk], dtype=float)
+        unit_prices = np.array([sale.unit_price for sale in chunk], dtype=float)
+        totals = np.round(quantities * unit_prices, 2)
+        yield from (sale._replace(total_amt=total) for sale, total in zip(chunk, totals.tolist()))
+
+
+def generate_employees(count, seed=0):
+    """Yield count synthetic employee records"""
+    rng = random.Random(seed)
+    first_day = date(2015, 1, 1).toordinal()
+    for emp_id in range(1, count + 1):
+        yield Employee(
+            emp_id,
+            f"Employee {emp_id}",
+            rng.choice(DEPARTMENTS),
+            round(rng.uniform(40000, 120000), 2),
+            date.fromordinal(first_day + rng.randrange(3650)),
+            rng.random() < 0.9,
+        )
+
+
+def generate_products(count, seed=0):
+    """Yield count synthetic product records"""
+    rng = random.Random(seed)
+    for number in range(1, count + 1):
+        category = rng.choice(CATEGORIES)
+        yield Product(
+            f"P{number:07d}",
+            f"{category} item {number}",
+            category,
+            round(rng.uniform(5, 2000), 2),
+            rng.randrange(200),
+            f"Generated {category.lower()} product number {number}",
+        )
+
 
+def generate_sales(count, seed=0):
+    """Yield count synthetic sales records (total_amt is filled in later)"""
+    rng = random.Random(seed)
+    first_day = date(2024, 1, 1).toordinal()
+    for number in range(1, count + 1):
+        yield Sale(
+            1000 + number,
+            f"Customer {rng.randrange(1, 10000)}",
+            f"P{rng.randrange(1, 10000):07d}",
+            rng.randrange(1, 10),
+            round(rng.uniform(5, 2000), 2),
+            date.fromordinal(first_day + rng.randrange(365)),
+        )
 
-def create_products_dbf():
-    """Create a sample products DBF file"""
+
+def create_employees_dbf(size=None):
+    """Create a sample employees DBF file (or size generated records) and return a status message"""
+    
+    # Sample data
+    employees = [
+        Employee(1, 'John Smith', 'Engineering', 75000.00, date(2020, 1, 15), True),
+        Employee(2, 'Sarah Johnson', 'Marketing', 65000.50, date(2019, 6, 10), True),
+        Employee(3, 'Michael Brown', 'Engineering', 82000.00, date(2018, 3, 22), True),
+        Employee(4, 'Emily Davis', 'HR', 58000.75, date(2021, 9, 5), True),
+        Employee(5, 'Robert Wilson', 'Finance', 70000.00, date(2017, 12, 1), True),
+        Employee(6, 'Lisa Anderson', 'Marketing', 67000.25, date(2020, 8, 18), False),
+        Employee(7, 'David Taylor', 'Engineering', 79000.00, date(2019, 2, 14), True),
+        Employee(8, 'Jennifer White', 'HR', 62000.00, date(2022, 4, 7), True),
+        Employee(9, 'Christopher Lee', 'Finance', 71500.50, date(2018, 11, 30), True),
+        Employee(10, 'Amanda Martinez', 'Engineering', 83000.00, date(2017, 5, 25), True),
+        Employee(11, 'James Garcia', 'Marketing', 66000.00, date(2021, 1, 12), True),
+        Employee(12, 'Michelle Rodriguez', 'Engineering', 77000.75, date(2020, 7, 3), True),
+        Employee(13, 'Thomas Hernandez', 'Finance', 69000.00, date(2019, 10, 8), False),
+        Employee(14, 'Jessica Lopez', 'HR', 61000.25, date(2021, 3, 20), True),
+        Employee(15, 'Daniel Gonzalez', 'Marketing', 68000.50, date(2018, 8, 16), True),
+    ]
     
-    # Define the table structure
-    table = dbf.Table(
-        'sample_products.dbf',
-        'prod_id C(10); prod_name C(50); category C(20); price N(8,2); in_stock N(6,0); descrip M'
-    )
+    if size is not None:
+        employees = generate_employees(size)
     
-    # Open the table for writing
-    table.open(mode=dbf.READ_WRITE)
+    return _create_dbf('sample_employees.dbf', EMPLOYEE_FIELDS, employees)
+
+
+def create_products_dbf(size=None):
+    """Create a sample products DBF file (or size generated records) and return a status message"""
     
     # Sample data
     products = [
-        ('LAPTOP001', 'Dell XPS 13 Laptop', 'Electronics', 1299.99, 25, 'High-performance ultrabook with 11th Gen Intel Core processor'),
-        ('PHONE001', 'iPhone 14 Pro', 'Electronics', 999.00, 50, 'Latest iPhone with Pro camera system and A16 Bionic chip'),
-        ('DESK001', 'Ergonomic Office Desk', 'Furniture', 299.95, 15, 'Height-adjustable standing desk with spacious work surface'),
-        ('CHAIR001', 'Herman Miller Aeron Chair', 'Furniture', 1395.00, 8, 'Premium ergonomic office chair with lumbar support'),
-        ('BOOK001', 'Python Programming Guide', 'Books', 49.99, 100, 'Comprehensive guide to Python programming for beginners'),
-        ('MONITOR01', 'LG 27 4K Monitor', 'Electronics', 399.99, 30, '27-inch 4K UHD monitor with HDR support'),
-        ('KEYBOARD1', 'Mechanical Gaming Keyboard', 'Electronics', 129.99, 45, 'RGB backlit mechanical keyboard with Cherry MX switches'),
-        ('MOUSE001', 'Wireless Gaming Mouse', 'Electronics', 79.99, 60, 'High-precision wireless gaming mouse with RGB lighting'),
-        ('TABLE001', 'Coffee Table', 'Furniture', 199.99, 12, 'Modern glass-top coffee table with metal legs'),
-        ('LAMP001', 'LED Desk Lamp', 'Furniture', 59.99, 75, 'Adjustable LED desk lamp with USB charging port'),
-        ('HEADSET01', 'Noise-Canceling Headphones', 'Electronics', 249.99, 20, 'Premium over-ear headphones with active noise cancellation'),
-        ('TABLET01', 'iPad Air', 'Electronics', 599.00, 35, '10.9-inch iPad Air with M1 chip and all-day battery life'),
-        ('PRINTER1', 'All-in-One Printer', 'Electronics', 149.99, 18, 'Wireless all-in-one inkjet printer with scanner and copier'),
-        ('STORAGE1', '1TB External SSD', 'Electronics', 89.99, 40, 'Portable 1TB external SSD with USB-C connectivity'),
-        ('WEBCAM01', '4K Webcam', 'Electronics', 199.99, 22, '4K webcam with auto-focus and built-in microphone'),
+        Product('LAPTOP001', 'Dell XPS 13 Laptop', 'Electronics', 1299.99, 25, 'High-performance ultrabook with 11th Gen Intel Core processor'),
+        Product('PHONE001', 'iPhone 14 Pro', 'Electronics', 999.00, 50, 'Latest iPhone with Pro camera system and A16 Bionic chip'),
+        Product('DESK001', 'Ergonomic Office Desk', 'Furniture', 299.95, 15, 'Height-adjustable standing desk with spacious work surface'),
+        Product('CHAIR001', 'Herman Miller Aeron Chair', 'Furniture', 1395.00, 8, 'Premium ergonomic office chair with lumbar support'),
+        Product('BOOK001', 'Python Programming Guide', 'Books', 49.99, 100, 'Comprehensive guide to Python programming for beginners'),
+        Product('MONITOR01', 'LG 27 4K Monitor', 'Electronics', 399.99, 30, '27-inch 4K UHD monitor with HDR support'),
+        Product('KEYBOARD1', 'Mechanical Gaming Keyboard', 'Electronics', 129.99, 45, 'RGB backlit mechanical keyboard with Cherry MX switches'),
+        Product('MOUSE001', 'Wireless Gaming Mouse', 'Electronics', 79.99, 60, 'High-precision wireless gaming mouse with RGB lighting'),
+        Product('TABLE001', 'Coffee Table', 'Furniture', 199.99, 12, 'Modern glass-top coffee table with metal legs'),
+        Product('LAMP001', 'LED Desk Lamp', 'Furniture', 59.99, 75, 'Adjustable LED desk lamp with USB charging port'),
+        Product('HEADSET01', 'Noise-Canceling Headphones', 'Electronics', 249.99, 20, 'Premium over-ear headphones with active noise cancellation'),
+        Product('TABLET01', 'iPad Air', 'Electronics', 599.00, 35, '10.9-inch iPad Air with M1 chip and all-day battery life'),
+        Product('PRINTER1', 'All-in-One Printer', 'Electronics', 149.99, 18, 'Wireless all-in-one inkjet printer with scanner and copier'),
+        Product('STORAGE1', '1TB External SSD', 'Electronics', 89.99, 40, 'Portable 1TB external SSD with USB-C connectivity'),
+        Product('WEBCAM01', '4K Webcam', 'Electronics', 199.99, 22, '4K webcam with auto-focus and built-in microphone'),
     ]
     
-    # Add records to the table
-    for prod_data in products:
-        table.append(prod_data)
-    
-    # Close the table
-    table.close()
+    if size is not None:
+        products = generate_products(size)
     
-    print(f"Created sample_products.dbf with {len(products)} records")
+    return _create_dbf('sample_products.dbf', PRODUCT_FIELDS, products)
 
 
-def create_sales_dbf():
-    """Create a sample sales transactions DBF file"""
-    
-    # Define the table structure
-    table = dbf.Table(
-        'sample_sales.dbf',
-        'sale_id N(8,0); customer C(40); prod_id C(10); quantity N(4,0); unit_price N(8,2); sale_date D; total_amt N(10,2)'
-    )
-    
-    # Open the table for writing
-    table.open(mode=dbf.READ_WRITE)
+def create_sales_dbf(size=None):
+    """Create a sample sales transactions DBF file (or size generated records) and return a status message"""
     
     # Sample data
     sales = [
-        (1001, 'Alice Johnson', 'LAPTOP001', 1, 1299.99, date(2024, 1, 15), 1299.99),
-        (1002, 'Bob Smith', 'PHONE001', 2, 999.00, date(2024, 1, 16), 1998.00),
-        (1003, 'Carol Davis', 'DESK001', 1, 299.95, date(2024, 1, 17), 299.95),
-        (1004, 'David Wilson', 'CHAIR001', 1, 1395.00, date(2024, 1, 18), 1395.00),
-        (1005, 'Eva Martinez', 'BOOK001', 3, 49.99, date(2024, 1, 19), 149.97),
-        (1006, 'Frank Brown', 'MONITOR01', 2, 399.99, date(2024, 1, 20), 799.98),
-        (1007, 'Grace Lee', 'KEYBOARD1', 1, 129.99, date(2024, 1, 21), 129.99),
-        (1008, 'Henry Garcia', 'MOUSE001', 2, 79.99, date(2024, 1, 22), 159.98),
-        (1009, 'Iris Rodriguez', 'TABLE001', 1, 199.99, date(2024, 1, 23), 199.99),
-        (1010, 'Jack Hernandez', 'LAMP001', 3, 59.99, date(2024, 1, 24), 179.97),
-        (1011, 'Kelly Lopez', 'HEADSET01', 1, 249.99, date(2024, 1, 25), 249.99),
-        (1012, 'Luis Gonzalez', 'TABLET01', 1, 599.00, date(2024, 1, 26), 599.00),
-        (1013, 'Maria Perez', 'PRINTER1', 1, 149.99, date(2024, 1, 27), 149.99),
-        (1014, 'Nathan Torres', 'STORAGE1', 2, 89.99, date(2024, 1, 28), 179.98),
-        (1015, 'Olivia Rivera', 'WEBCAM01', 1, 199.99, date(2024, 1, 29), 199.99),
-        (1016, 'Paul Cooper', 'LAPTOP001', 1, 1299.99, date(2024, 1, 30), 1299.99),
-        (1017, 'Quinn Murphy', 'PHONE001', 1, 999.00, date(2024, 1, 31), 999.00),
-        (1018, 'Rachel Ward', 'DESK001', 2, 299.95, date(2024, 2, 1), 599.90),
-        (1019, 'Steve Bailey', 'KEYBOARD1', 2, 129.99, date(2024, 2, 2), 259.98),
-        (1020, 'Tina Foster', 'MOUSE001', 1, 79.99, date(2024, 2, 3), 79.99),
+        Sale(1001, 'Alice Johnson', 'LAPTOP001', 1, 1299.99, date(2024, 1, 15)),
+        Sale(1002, 'Bob Smith', 'PHONE001', 2, 999.00, date(2024, 1, 16)),
+        Sale(1003, 'Carol Davis', 'DESK001', 1, 299.95, date(2024, 1, 17)),
+        Sale(1004, 'David Wilson', 'CHAIR001', 1, 1395.00, date(2024, 1, 18)),
+        Sale(1005, 'Eva Martinez', 'BOOK001', 3, 49.99, date(2024, 1, 19)),
+        Sale(1006, 'Frank Brown', 'MONITOR01', 2, 399.99, date(2024, 1, 20)),
+        Sale(1007, 'Grace Lee', 'KEYBOARD1', 1, 129.99, date(2024, 1, 21)),
+        Sale(1008, 'Henry Garcia', 'MOUSE001', 2, 79.99, date(2024, 1, 22)),
+        Sale(1009, 'Iris Rodriguez', 'TABLE001', 1, 199.99, date(2024, 1, 23)),
+        Sale(1010, 'Jack Hernandez', 'LAMP001', 3, 59.99, date(2024, 1, 24)),
+        Sale(1011, 'Kelly Lopez', 'HEADSET01', 1, 249.99, date(2024, 1, 25)),
+        Sale(1012, 'Luis Gonzalez', 'TABLET01', 1, 599.00, date(2024, 1, 26)),
+        Sale(1013, 'Maria Perez', 'PRINTER1', 1, 149.99, date(2024, 1, 27)),
+        Sale(1014, 'Nathan Torres', 'STORAGE1', 2, 89.99, date(2024, 1, 28)),
+        Sale(1015, 'Olivia Rivera', 'WEBCAM01', 1, 199.99, date(2024, 1, 29)),
+        Sale(1016, 'Paul Cooper', 'LAPTOP001', 1, 1299.99, date(2024, 1, 30)),
+        Sale(1017, 'Quinn Murphy', 'PHONE001', 1, 999.00, date(2024, 1, 31)),
+        Sale(1018, 'Rachel Ward', 'DESK001', 2, 299.95, date(2024, 2, 1)),
+        Sale(1019, 'Steve Bailey', 'KEYBOARD1', 2, 129.99, date(2024, 2, 2)),
+        Sale(1020, 'Tina Foster', 'MOUSE001', 1, 79.99, date(2024, 2, 3)),
     ]
     
-    # Add records to the table
-    for sale_data in sales:
-        table.append(sale_data)
+    if size is not None:
+        sales = generate_sales(size)
     
-    # Close the table
-    table.close()
-    
-    print(f"Created sample_sales.dbf with {len(sales)} records")
+    return _create_dbf('sample_sales.dbf', SALE_FIELDS, _with_sale_totals(sales))
+
 
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Create sample DBF files for EDVAN DBF Commander.")
+    parser.add_argument('--size', type=int, metavar='N',
+                        help="generate N synthetic records per table instead of the built-in samples")
+    args = parser.parse_args(argv)
+    if args.size is not None and not 0 <= args.size <= MAX_GENERATED_ROWS:
+        parser.error(f"--size must be between 0 and {MAX_GENERATED_ROWS:,}")
+    return args
 
-def main():
+
+def main(argv=None):
     """Create all sample DBF files"""
     
-    print("Creating sample DBF files for EDVAN DBF Commander...")
-    print("=" * 50)
+    args = parse_args(argv)
+    
+    # Collect the report and write it once at the end
+    messages = [
+        "Creating sample DBF files for EDVAN DBF Commander...",
+        "=" * 50,
+    ]
+    
+    creators = (create_employees_dbf, create_products_dbf, create_sales_dbf)
     
     try:
-        create_employees_dbf()
-        create_products_dbf()
-        create_sales_dbf()
+        # The tables are independent files, so build them in parallel and
+        # report the results in a fixed order
+        with ProcessPoolExecutor(max_workers=len(creators)) as executor:
+            futures = [executor.submit(creator, args.size) for creator in creators]
+            messages.extend(future.result() for future in futures)
         
-        print("=" * 50)
-        print("✅ All sample DBF files created successfully!")
-        print("\nFiles created:")
-        print("- sample_employees.dbf (Employee data)")
-        print("- sample_products.dbf (Product catalog)")
-        print("- sample_sales.dbf (Sales transactions)")
-        print("\nYou can now open these files in EDVAN DBF Commander to test the application.")
+        messages.extend([
+            "=" * 50,
+            "✅ All sample DBF files created successfully!",
+            "\nFiles created:",
+            "- sample_employees.dbf (Employee data)",
+            "- sample_products.dbf (Product catalog)",
+            "- sample_sales.dbf (Sales transactions)",
+            "\nYou can now open these files in EDVAN DBF Commander to test the application.",
+        ])
+        status = 0
         
     except Exception as e:
-        print(f"❌ Error creating sample files: {str(e)}")
-        return 1
+        messages.append(f"❌ Error creating sample files: {str(e)}")
+        status = 1
     
-    return 0
+    sys.stdout.write("\n".join(messages) + "\n")
+    sys.stdout.flush()
+    return status
 
 
 if __name__ == "__main__":
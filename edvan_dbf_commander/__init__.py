@@ -9,9 +9,19 @@ This package contains the modular structure:
 - main.py - Main application class
 """
 
-from .main import EDVANDBFCommander, main
-
 __version__ = "1.1.0"
 __author__ = "rusli3"
 
+from importlib import import_module
+
 __all__ = ['EDVANDBFCommander', 'main']
+
+
+def __getattr__(name):
+    # The application module (and the GUI toolkit) is loaded on first use
+    if name in __all__:
+        main_module = import_module('.main', __name__)
+        value = getattr(main_module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
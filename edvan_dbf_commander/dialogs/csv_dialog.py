@@ -7,21 +7,39 @@ Dialog for configuring and executing CSV conversion from DBF or DTA files.
 """
 
 import os
+import io
+import codecs
 import csv
+import types
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
+from ..utils.background import run_in_background
+from ..utils.dbf_reader import iter_dbf_chunks
+from ..utils.dtypes import PYARROW_SUPPORT
+from ..utils.fonts import heading_font, title_font
+from ..utils.optional import has_module, load_pyarrow, load_pyreadstat
 import pandas as pd
 from dbfpy3 import dbf
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Check for Stata support
-STATA_SUPPORT = True
-try:
-    import pyreadstat
-except ImportError:
-    STATA_SUPPORT = False
+# Check for Stata support; pyreadstat itself is imported on first use
+STATA_SUPPORT = has_module('pyreadstat')
+
+# Rows written per chunk and output buffer size for CSV export
+CSV_CHUNK_ROWS = 50_000
+CSV_BUFFER_SIZE = 8 << 20
+
+# Encodings pyarrow's CSV writer can produce, with the bytes written first
+ARROW_CSV_ENCODINGS = {'utf-8': b'', 'utf-8-sig': codecs.BOM_UTF8}
+
+# Rows read per chunk when streaming a Stata file to CSV
+DTA_CHUNK_ROWS = 100_000
+
+# Rows and columns shown in the data preview
+PREVIEW_ROWS = 20
+PREVIEW_MAX_COLS = 50
 
 
 class CSVConversionDialog(ctk.CTkToplevel):
@@ -32,8 +50,12 @@ class CSVConversionDialog(ctk.CTkToplevel):
         self.parent = parent
         self.source_file_path = source_file_path
         self.file_type = file_type  # "dbf" or "dta"
+        # Cache file name and size for the info text; size is read on first use
+        self._file_base = os.path.basename(source_file_path)
+        self._file_size = None
         self.df = None
         self.meta = None
+        self._preview_cache = None
         
         self.title(f"Convert {file_type.upper()} to CSV")
         self.geometry("500x600")
@@ -51,7 +73,7 @@ class CSVConversionDialog(ctk.CTkToplevel):
         
         # Title
         title_label = ctk.CTkLabel(main_frame, text=f"Convert {self.file_type.upper()} to CSV", 
-                                  font=ctk.CTkFont(size=20, weight="bold"))
+                                  font=title_font())
         title_label.pack(pady=(0, 20))
         
         # File info frame
@@ -59,9 +81,10 @@ class CSVConversionDialog(ctk.CTkToplevel):
         info_frame.pack(fill="x", pady=10)
         
         ctk.CTkLabel(info_frame, text="File Information:", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", padx=10, pady=5)
+                    font=heading_font()).pack(anchor="w", padx=10, pady=5)
         
-        self.info_text = ctk.CTkTextbox(info_frame, height=120)
+        self.info_text = ctk.CTkTextbox(info_frame, height=120, wrap="none",
+                                        state="disabled")
         self.info_text.pack(fill="x", padx=10, pady=5)
         
         # CSV Options frame
@@ -69,7 +92,7 @@ class CSVConversionDialog(ctk.CTkToplevel):
         options_frame.pack(fill="x", pady=10)
         
         ctk.CTkLabel(options_frame, text="CSV Options:", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", padx=10, pady=5)
+                    font=heading_font()).pack(anchor="w", padx=10, pady=5)
         
         # Delimiter selection
         delimiter_frame = ctk.CTkFrame(options_frame)
@@ -118,79 +141,136 @@ class CSVConversionDialog(ctk.CTkToplevel):
                      command=self.destroy).pack(side="right", padx=5)
     
     def load_file_info(self):
-        """Load file information"""
-        try:
-            if self.file_type == "dta":
-                self.load_dta_info()
-            else:
-                self.load_dbf_info()
-        except Exception as e:
-            error_msg = f"Error loading file: {str(e)}\n\nPlease check if the file is valid and accessible."
-            self.info_text.delete("1.0", "end")
-            self.info_text.insert("1.0", error_msg)
+        """Load file information on a background thread"""
+        self._set_info("Loading…")
+        run_in_background(self, self._bg_load,
+                          lambda result: self._apply_info(*result),
+                          self._on_load_error)
+    
+    def _bg_load(self):
+        """Read the source file header and build its summary (runs on the I/O pool)"""
+        # Only the header is read here; rows are loaded on demand
+        if self.file_type == "dta":
+            df, meta = self.load_dta_info()
+        else:
+            df, meta = self.load_dbf_info()
+        column_types = ((col, meta.readstat_variable_types[col])
+                        for col in meta.column_names)
+        return df, meta, self.build_info(meta.number_rows, column_types)
+    
+    def _on_load_error(self, e: Exception):
+        """Show why the source file could not be loaded"""
+        error_msg = f"Error loading file: {str(e)}\n\nPlease check if the file is valid and accessible."
+        self._apply_info(None, None, error_msg)
+    
+    def _set_info(self, text: str):
+        """Replace the read-only info pane text in a single insert"""
+        self.info_text.configure(state="normal")
+        self.info_text.delete("1.0", "end")
+        self.info_text.insert("1.0", text)
+        self.info_text.configure(state="disabled")
+    
+    def _apply_info(self, df, meta, info: str):
+        """Store loaded data and show its summary (runs on the UI thread)"""
+        self.df = df
+        self.meta = meta
+        self._preview_cache = None
+        self._set_info(info)
     
     def load_dta_info(self):
-        """Load Stata file information"""
+        """Read the Stata file metadata without loading any rows"""
         if not STATA_SUPPORT:
-            self.info_text.insert("1.0", "Error: pyreadstat library not available.\nPlease install it with: pip install pyreadstat")
-            return
-        
-        # Read the Stata file with metadata
-        self.df, self.meta = pyreadstat.read_dta(self.source_file_path)
-        
-        # Display file information
-        info = f"""File: {os.path.basename(self.source_file_path)}
-Size: {os.path.getsize(self.source_file_path):,} bytes
-Records: {len(self.df):,}
-Columns: {len(self.df.columns)}
-
-Column Information:
-{'-'*40}
-"""
+            return self._load_dta_info_pandas()
         
-        for col in self.df.columns:
-            dtype = str(self.df[col].dtype)
-            info += f"{col:<15} {dtype:<12}\n"
+        _, meta = load_pyreadstat().read_dta(self.source_file_path, metadataonly=True)
+        return None, meta
+    
+    def _load_dta_info_pandas(self):
+        """Read Stata metadata and preview rows with pandas when pyreadstat is missing"""
+        with pd.read_stata(self.source_file_path, chunksize=DTA_CHUNK_ROWS) as reader:
+            column_labels = reader.variable_labels()
+            # pandas does not expose the row count publicly, so the rows
+            # are counted while streaming past them
+            chunk = next(reader, None)
+            if chunk is None:
+                df, number_rows = pd.DataFrame(columns=list(column_labels)), 0
+            else:
+                df = chunk.iloc[:PREVIEW_ROWS].copy()
+                number_rows = len(chunk) + sum(len(rest) for rest in reader)
+        
+        # Mirror the pyreadstat metadata attributes used by this dialog
+        meta = types.SimpleNamespace(
+            number_rows=number_rows,
+            column_names=list(column_labels),
+            column_labels=column_labels,
+            readstat_variable_types={col: str(dtype) for col, dtype in df.dtypes.items()}
+        )
+        return df, meta
+    
+    def _load_rows(self, row_limit: int):
+        """Read the first row_limit rows of the source file into self.df"""
+        if self.file_type == "dta":
+            self.df, _ = load_pyreadstat().read_dta(self.source_file_path, row_limit=row_limit)
+            return
         
-        self.info_text.delete("1.0", "end")
-        self.info_text.insert("1.0", info)
+        chunk = next(iter_dbf_chunks(self.source_file_path, row_limit), None)
+        self.df = pd.DataFrame(columns=self.meta.column_names) if chunk is None else chunk
+        self.df.columns = self.meta.column_names
     
     def load_dbf_info(self):
-        """Load DBF file information"""
-        # Read DBF file using dbfpy3
-        with dbf.Dbf(self.source_file_path) as db:
-            records = []
-            field_names = [field.name for field in db.header.fields]
-            
-            for record in db:
-                records.append([record[field] for field in field_names])
-            
-            # Create DataFrame
-            self.df = pd.DataFrame(records, columns=field_names)
-        
-        # Display file information
-        info = f"""File: {os.path.basename(self.source_file_path)}
-Size: {os.path.getsize(self.source_file_path):,} bytes
-Records: {len(self.df):,}
-Columns: {len(self.df.columns)}
-
-Column Information:
-{'-'*40}
-"""
-        
-        for col in self.df.columns:
-            dtype = str(self.df[col].dtype)
-            info += f"{col:<15} {dtype:<12}\n"
+        """Read the DBF header without loading any rows"""
+        with dbf.Dbf(self.source_file_path, read_only=True) as db:
+            header = db.header
+            encoding = header.code_page.encoding
+            field_types = {
+                field.name.decode(encoding, 'replace'): (
+                    f"{field.type_code.decode('ascii')}({field.length}"
+                    + (f",{field.decimal_count})" if field.decimal_count else ")")
+                )
+                for field in header.fields
+            }
         
-        self.info_text.delete("1.0", "end")
-        self.info_text.insert("1.0", info)
+        # Mirror the pyreadstat metadata attributes used by this dialog
+        meta = types.SimpleNamespace(
+            number_rows=header.record_count,
+            column_names=list(field_types),
+            readstat_variable_types=field_types
+        )
+        return None, meta
+    
+    def build_info(self, record_count: int, column_types) -> str:
+        """Build the file information text from (column, type) pairs"""
+        if self._file_size is None:
+            self._file_size = os.path.getsize(self.source_file_path)
+        
+        column_lines = [f"{col:<15} {dtype:<12}" for col, dtype in column_types]
+        parts = [
+            f"File: {self._file_base}",
+            f"Size: {self._file_size:,} bytes",
+            f"Records: {record_count:,}",
+            f"Columns: {len(column_lines)}",
+            "",
+            "Column Information:",
+            "-" * 40,
+        ]
+        parts.extend(column_lines)
+        
+        return "\n".join(parts) + "\n"
     
     def preview_data(self):
         """Preview the data in a separate window"""
-        if self.df is None:
+        if self.df is None and self.meta is None:
             messagebox.showerror("Error", "No data loaded. Please check the file.")
             return
         
+        # Rows are not loaded with the metadata; read just the preview rows
+        if self.df is None:
+            try:
+                self._load_rows(row_limit=PREVIEW_ROWS)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to read data: {str(e)}")
+                return
+        
         # Create preview window
         preview_window = ctk.CTkToplevel(self)
         preview_window.title("Data Preview")
@@ -201,17 +281,54 @@ Column Information:
         preview_text = ctk.CTkTextbox(preview_window)
         preview_text.pack(fill="both", expand=True, padx=10, pady=10)
         
-        # Show first 20 rows
-        preview_data = self.df.head(20).to_string()
-        preview_text.insert("1.0", f"First 20 rows preview:\n\n{preview_data}")
+        # Show first 20 rows, capping the columns formatted for wide files
+        if self._preview_cache is None:
+            self._preview_cache = self._format_preview(
+                self.df.iloc[:PREVIEW_ROWS, :PREVIEW_MAX_COLS]
+            )
+        preview_text.insert("1.0", f"First 20 rows preview:\n\n{self._preview_cache}")
         
         # Add close button
         ctk.CTkButton(preview_window, text="Close", 
                      command=preview_window.destroy).pack(pady=10)
     
+    @staticmethod
+    def _format_preview(head: pd.DataFrame) -> str:
+        """Format preview rows as fixed-width text, one line per row"""
+        # Missing values show blank, as in the data tabs
+        cells = head.astype(str).where(head.notna(), "").to_numpy()
+        lines = [" | ".join(f"{str(col):>12}" for col in head.columns)]
+        lines.extend(" | ".join(f"{value:>12}" for value in row) for row in cells)
+        return "\n".join(lines)
+    
+    def _iter_export_chunks(self):
+        """Yield the data to export as DataFrame chunks"""
+        # DBF records are streamed from disk instead of the loaded frame
+        if self.file_type == "dbf":
+            yield from iter_dbf_chunks(self.source_file_path, CSV_CHUNK_ROWS)
+            return
+        
+        # Stata files are streamed from disk unless every row is already loaded
+        if self.meta is not None and (self.df is None or len(self.df) < self.meta.number_rows):
+            if STATA_SUPPORT:
+                # The row count is already known, so read each slice directly
+                # rather than have pyreadstat parse the metadata again first
+                read_dta = load_pyreadstat().read_dta
+                for offset in range(0, self.meta.number_rows, DTA_CHUNK_ROWS):
+                    chunk, _ = read_dta(self.source_file_path,
+                                        row_offset=offset, row_limit=DTA_CHUNK_ROWS)
+                    yield chunk
+            else:
+                with pd.read_stata(self.source_file_path, chunksize=DTA_CHUNK_ROWS) as reader:
+                    yield from reader
+            return
+        
+        for chunk_start in range(0, len(self.df), CSV_CHUNK_ROWS):
+            yield self.df.iloc[chunk_start:chunk_start + CSV_CHUNK_ROWS]
+    
     def convert_to_csv(self):
         """Convert file to CSV"""
-        if self.df is None:
+        if self.df is None and self.meta is None:
             messagebox.showerror("Error", "No data loaded. Please check the file.")
             return
         
@@ -220,47 +337,44 @@ Column Information:
             title="Save CSV File",
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            initialvalue=f"{os.path.splitext(os.path.basename(self.source_file_path))[0]}.csv"
+            initialvalue=f"{os.path.splitext(self._file_base)[0]}.csv"
         )
         
         if not csv_path:
             return
         
         try:
-            # Prepare data for export
-            export_df = self.df.copy()
-            
-            # Remove empty rows if requested
-            if self.remove_empty.get():
-                export_df = export_df.dropna(how='all')
-            
             # Get CSV options
             delimiter = self.delimiter_var.get()
             
             encoding = self.encoding_var.get()
             include_headers = self.include_headers.get()
-            
-            # Configure CSV writing options
-            csv_options = {
-                'sep': delimiter,
-                'encoding': encoding,
-                'index': False,
-                'header': include_headers
-            }
+            remove_empty = self.remove_empty.get()
             
             # Handle quoting
             if self.quote_strings.get():
-                csv_options['quoting'] = csv.QUOTE_NONNUMERIC
+                quoting = csv.QUOTE_NONNUMERIC
             else:
-                csv_options['quoting'] = csv.QUOTE_MINIMAL
+                quoting = csv.QUOTE_MINIMAL
             
-            # Export to CSV
-            export_df.to_csv(csv_path, **csv_options)
+            header = None
+            if include_headers:
+                header = self.df.columns if self.meta is None else self.meta.column_names
+            
+            # Arrow's writer only produces UTF-8 and quotes all text; chunks it
+            # would format differently from pandas are still written by pandas
+            if (PYARROW_SUPPORT and quoting == csv.QUOTE_NONNUMERIC
+                    and encoding.lower() in ARROW_CSV_ENCODINGS):
+                records_exported = self._write_csv_arrow(csv_path, delimiter, encoding,
+                                                         header, remove_empty)
+            else:
+                records_exported = self._write_csv_pandas(csv_path, delimiter, encoding,
+                                                          quoting, header, remove_empty)
             
             # Show success message
             messagebox.showinfo("Conversion Complete", 
                               f"File successfully converted to CSV:\n{csv_path}\n\n" +
-                              f"Records exported: {len(export_df):,}")
+                              f"Records exported: {records_exported:,}")
             
             logger.info(f"{self.file_type.upper()} to CSV conversion completed: {csv_path}")
             self.destroy()
@@ -268,3 +382,95 @@ Column Information:
         except Exception as e:
             messagebox.showerror("Conversion Error", f"Failed to convert file: {str(e)}")
             logger.error(f"CSV conversion failed: {str(e)}")
+    
+    def _export_chunks(self, remove_empty: bool):
+        """Yield the chunks to write, without empty rows if requested"""
+        for chunk in self._iter_export_chunks():
+            if remove_empty:
+                # Only slice when the chunk actually has empty rows
+                keep = chunk.notna().to_numpy().any(axis=1)
+                if not keep.all():
+                    chunk = chunk.iloc[keep]
+            yield chunk
+    
+    def _write_csv_pandas(self, csv_path: str, delimiter: str, encoding: str,
+                          quoting: int, header, remove_empty: bool) -> int:
+        """Write the export chunks through pandas' C CSV writer; returns the row count"""
+        records_exported = 0
+        # Characters the encoding cannot represent are written as '?' rather
+        # than aborting the export part way through the file
+        with open(csv_path, 'w', newline='', encoding=encoding, errors='replace',
+                  buffering=CSV_BUFFER_SIZE) as csv_file:
+            if header is not None:
+                writer = csv.writer(csv_file, delimiter=delimiter, quoting=quoting,
+                                    lineterminator=os.linesep)
+                writer.writerow(header)
+            
+            for chunk in self._export_chunks(remove_empty):
+                # Missing values are written as empty fields
+                chunk.to_csv(csv_file, sep=delimiter, quoting=quoting,
+                             header=False, index=False, lineterminator=os.linesep)
+                records_exported += len(chunk)
+        return records_exported
+    
+    def _write_csv_arrow(self, csv_path: str, delimiter: str, encoding: str,
+                         header, remove_empty: bool) -> int:
+        """Write the export chunks through pyarrow's CSV writer; returns the row count"""
+        import pyarrow.csv as pacsv
+        
+        # "needed" quotes every string value and no numbers
+        write_options = pacsv.WriteOptions(include_header=False, delimiter=delimiter,
+                                           eol=os.linesep, quoting_style='needed')
+        records_exported = 0
+        with open(csv_path, 'wb', buffering=CSV_BUFFER_SIZE) as csv_file:
+            csv_file.write(ARROW_CSV_ENCODINGS[encoding.lower()])
+            if header is not None:
+                csv_file.write(self._format_rows([header], delimiter).encode('utf-8'))
+            
+            for chunk in self._export_chunks(remove_empty):
+                table = self._arrow_text_table(chunk)
+                if table is None:
+                    text = chunk.to_csv(sep=delimiter, quoting=csv.QUOTE_NONNUMERIC,
+                                        header=False, index=False, lineterminator=os.linesep)
+                    csv_file.write(text.encode('utf-8'))
+                else:
+                    pacsv.write_csv(table, csv_file, write_options=write_options)
+                records_exported += len(chunk)
+        return records_exported
+    
+    @staticmethod
+    def _arrow_text_table(chunk: pd.DataFrame):
+        """
+        Arrow table of a chunk whose Arrow CSV text is identical to pandas'
+        QUOTE_NONNUMERIC output, or None if pandas must format the chunk.
+        
+        That holds for plain integer columns and for text columns once
+        missing values are empty strings; floats, booleans and dates are
+        formatted differently by Arrow.
+        """
+        pa = load_pyarrow()
+        columns = {}
+        for i, (_, values) in enumerate(chunk.items()):
+            if values.dtype.kind in 'iu':
+                columns[str(i)] = values
+            elif (isinstance(values.dtype, pd.StringDtype)
+                  or pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty')):
+                # pandas writes missing text as a quoted empty string
+                columns[str(i)] = values.astype(object).where(values.notna(), '').astype(str)
+            else:
+                return None
+        
+        try:
+            return pa.Table.from_pandas(pd.DataFrame(columns, index=chunk.index),
+                                        preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            logger.debug(f"Arrow conversion failed, using pandas CSV writer: {e}")
+            return None
+    
+    @staticmethod
+    def _format_rows(rows, delimiter: str) -> str:
+        """Format rows as quoted CSV text"""
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter=delimiter, quoting=csv.QUOTE_NONNUMERIC,
+                   lineterminator=os.linesep).writerows(rows)
+        return buffer.getvalue()
@@ -6,12 +6,21 @@ Find and Replace Dialog
 Provides actual find and replace functionality for DBF data.
 """
 
+import re
+from typing import Iterator
+import numpy as np
+import pandas as pd
 import customtkinter as ctk
+from ..utils.dtypes import PYARROW_SUPPORT
+from ..utils.fonts import get_font
 from tkinter import messagebox
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows compared per step of a search
+SEARCH_BLOCK_ROWS = 10_000
+
 
 class FindReplaceDialog(ctk.CTkToplevel):
     """Find and Replace dialog with actual implementation"""
@@ -22,6 +31,8 @@ class FindReplaceDialog(ctk.CTkToplevel):
         self.data_tab = data_tab
         self.current_match_index = -1
         self.matches = []  # List of (row_idx, col_name, cell_value) tuples
+        self._match_iter = None  # Further matches of the current search, found on demand
+        self._last_search = None
         
         self.title("Find & Replace")
         self.geometry("450x350")
@@ -37,7 +48,7 @@ class FindReplaceDialog(ctk.CTkToplevel):
         
         # Title
         title_label = ctk.CTkLabel(main_frame, text="Find & Replace", 
-                                  font=ctk.CTkFont(size=18, weight="bold"))
+                                  font=get_font(18, "bold"))
         title_label.pack(pady=(0, 20))
         
         # Find section
@@ -85,35 +96,94 @@ class FindReplaceDialog(ctk.CTkToplevel):
         ctk.CTkButton(buttons_frame, text="Close", 
                      command=self.destroy).pack(side="right", padx=5)
     
-    def _search_data(self, find_text: str) -> list:
-        """Search the data for matching cells"""
-        matches = []
-        
-        if not find_text:
-            return matches
+    def _search(self, find_text: str):
+        """
+        Start a search for cells matching find_text.
         
-        df = self.data_tab.filtered_df if self.data_tab.filtered_df is not None else self.data_tab.df
+        Returns:
+            tuple: (columns, texts, blocks) - the searched column names, each
+            column's cell text in display order, and a generator of
+            (rows, column positions) arrays of the hits in each block of rows
+        """
+        df = self.data_tab.get_display_df() if find_text else None
         if df is None:
-            return matches
+            return [], [], iter(())
         
         case_sensitive = self.case_sensitive.get()
         partial_match = self.partial_match.get()
         
-        search_text = find_text if case_sensitive else find_text.lower()
+        columns = list(df.columns)
+        texts = [self.data_tab.get_column_text(col_name) for col_name in columns]
+        matcher = self._arrow_matcher if PYARROW_SUPPORT else self._pandas_matcher
+        match_block = matcher(columns, find_text, case_sensitive, partial_match)
         
-        for row_idx, row in df.iterrows():
-            for col_name in df.columns:
-                cell_value = str(row[col_name]) if row[col_name] is not None else ""
-                compare_value = cell_value if case_sensitive else cell_value.lower()
+        def blocks():
+            # Compare a block of rows a column at a time; hits come out row-major
+            for block_start in range(0, len(df), SEARCH_BLOCK_ROWS):
+                block_rows = min(SEARCH_BLOCK_ROWS, len(df) - block_start)
+                hits = np.zeros((block_rows, len(columns)), dtype=bool)
+                for col_pos in range(len(columns)):
+                    hits[:, col_pos] = match_block(col_pos, block_start, block_rows)
                 
-                if partial_match:
-                    if search_text in compare_value:
-                        matches.append((row_idx, col_name, cell_value))
-                else:
-                    if search_text == compare_value:
-                        matches.append((row_idx, col_name, cell_value))
+                rows, cols = np.nonzero(hits)
+                yield block_start + rows, cols
+        
+        return columns, texts, blocks()
+    
+    def _pandas_matcher(self, columns: list, find_text: str, case_sensitive: bool,
+                        partial_match: bool):
+        """Function giving the match flags of a block of one column, using pandas"""
+        search_text = find_text if case_sensitive else find_text.lower()
+        compares = [self.data_tab.get_column_text(col_name, lower=not case_sensitive)
+                    for col_name in columns]
+        
+        def match_block(col_pos: int, start: int, length: int) -> np.ndarray:
+            values = pd.Series(compares[col_pos][start:start + length], dtype=object)
+            if partial_match:
+                found = values.str.contains(search_text, regex=False)
+            else:
+                found = values.eq(search_text)
+            return found.to_numpy(dtype=bool)
+        
+        return match_block
+    
+    def _arrow_matcher(self, columns: list, find_text: str, case_sensitive: bool,
+                       partial_match: bool):
+        """Function giving the match flags of a block of one column, using pyarrow compute"""
+        import pyarrow.compute as pc
+        strings = [self.data_tab.get_column_strings(col_name) for col_name in columns]
+        search_text = find_text if case_sensitive else find_text.lower()
+        
+        def match_block(col_pos: int, start: int, length: int) -> np.ndarray:
+            values = strings[col_pos].slice(start, length)
+            if partial_match:
+                found = pc.match_substring(values, find_text, ignore_case=not case_sensitive)
+            else:
+                if not case_sensitive:
+                    values = pc.utf8_lower(values)
+                found = pc.equal(values, search_text)
+            return found.to_numpy(zero_copy_only=False)
         
-        return matches
+        return match_block
+    
+    def _iter_matches(self, find_text: str) -> Iterator[tuple]:
+        """Yield (row_idx, col_name, cell_value) for the matching cells in display order"""
+        # Hits are handed out one at a time, so Find Next only scans as far
+        # as the block holding the next match
+        columns, texts, blocks = self._search(find_text)
+        for rows, cols in blocks:
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                yield row, columns[col], texts[col][row]
+    
+    def _find_more(self):
+        """Add the next match of the current search to self.matches, if any"""
+        if self._match_iter is None:
+            return
+        match = next(self._match_iter, None)
+        if match is None:
+            self._match_iter = None
+        else:
+            self.matches.append(match)
     
     def find_next(self):
         """Find next occurrence"""
@@ -122,13 +192,23 @@ class FindReplaceDialog(ctk.CTkToplevel):
             self.status_label.configure(text="Please enter search text")
             return
         
+        # Search again once the tab's data has loaded, if the dialog is still open
+        if not self.data_tab.require_data(lambda: self.winfo_exists() and self.find_next()):
+            return
+        
         try:
-            # Search if matches list is empty or search text changed
-            if not self.matches or not hasattr(self, '_last_search') or self._last_search != find_text:
-                self.matches = self._search_data(find_text)
+            # Start a new search if the last one is used up or the search text changed
+            if ((not self.matches and self._match_iter is None)
+                    or self._last_search != find_text):
+                self.matches = []
+                self._match_iter = self._iter_matches(find_text)
                 self.current_match_index = -1
                 self._last_search = find_text
             
+            # Find one more match once every match found so far has been visited
+            if self.current_match_index + 1 >= len(self.matches):
+                self._find_more()
+            
             if not self.matches:
                 self.status_label.configure(text="No matches found")
                 return
@@ -137,9 +217,10 @@ class FindReplaceDialog(ctk.CTkToplevel):
             self.current_match_index = (self.current_match_index + 1) % len(self.matches)
             row_idx, col_name, cell_value = self.matches[self.current_match_index]
             
-            # Update status
+            # Update status; the total is only known once the search is complete
+            total = f" of {len(self.matches)}" if self._match_iter is None else ""
             self.status_label.configure(
-                text=f"Match {self.current_match_index + 1} of {len(self.matches)}: "
+                text=f"Match {self.current_match_index + 1}{total}: "
                      f"Row {row_idx}, Column '{col_name}'"
             )
             
@@ -180,6 +261,17 @@ class FindReplaceDialog(ctk.CTkToplevel):
         except Exception as e:
             logger.warning(f"Could not highlight match: {str(e)}")
     
+    def _replace_texts(self, texts: pd.Series, find_text: str, replace_text: str) -> pd.Series:
+        """Replace find_text in each cell text under the current options"""
+        if self.case_sensitive.get():
+            return texts.str.replace(find_text, replace_text, regex=False)
+        
+        # Compiled once per replace rather than for every cell
+        pattern = re.compile(re.escape(find_text), re.IGNORECASE)
+        # Backslashes in the replacement are literal text, not group references
+        replacement = replace_text.replace('\\', r'\\')
+        return texts.str.replace(pattern, replacement, regex=True)
+    
     def replace_current(self):
         """Replace current selection"""
         if not self.matches or self.current_match_index < 0:
@@ -200,27 +292,30 @@ class FindReplaceDialog(ctk.CTkToplevel):
             df = self.data_tab.df
             
             # Perform replacement
-            case_sensitive = self.case_sensitive.get()
-            if case_sensitive:
-                new_value = cell_value.replace(find_text, replace_text)
-            else:
-                import re
-                new_value = re.sub(re.escape(find_text), replace_text, cell_value, flags=re.IGNORECASE)
+            new_value = self._replace_texts(
+                pd.Series([cell_value], dtype=object), find_text, replace_text
+            ).iloc[0]
             
-            # Update the dataframe
-            df.at[row_idx, col_name] = new_value
+            # Update the dataframe (matches are numbered in display order)
+            df.at[self.data_tab.get_row_position(row_idx), col_name] = new_value
             
             # Mark as modified
             self.data_tab.modified = True
             
-            # Refresh display
-            self.data_tab.update_data_display()
+            # Refresh the display if the replaced cell is on the shown page
+            if row_idx // self.data_tab.rows_per_page == self.data_tab.current_page:
+                self.data_tab.schedule_repaint()
             
             # Remove the current match and find next
             self.matches.pop(self.current_match_index)
+            if self.current_match_index >= len(self.matches):
+                self._find_more()
             if self.matches:
                 self.current_match_index = self.current_match_index % len(self.matches)
-                self.status_label.configure(text=f"Replaced. {len(self.matches)} matches remaining")
+                if self._match_iter is None:
+                    self.status_label.configure(text=f"Replaced. {len(self.matches)} matches remaining")
+                else:
+                    self.status_label.configure(text="Replaced")
             else:
                 self.current_match_index = -1
                 self.status_label.configure(text="All matches replaced")
@@ -245,15 +340,19 @@ class FindReplaceDialog(ctk.CTkToplevel):
             return
         
         try:
-            # Get fresh matches
-            self.matches = self._search_data(find_text)
+            # Get fresh matches as row and column position arrays
+            columns, texts, blocks = self._search(find_text)
+            found = list(blocks)
+            rows = np.concatenate([block_rows for block_rows, _ in found] or [[]]).astype(int)
+            cols = np.concatenate([block_cols for _, block_cols in found] or [[]]).astype(int)
+            self._match_iter = None
             
-            if not self.matches:
+            count = len(rows)
+            if not count:
+                self.matches = []
                 self.status_label.configure(text="No matches found")
                 return
             
-            count = len(self.matches)
-            
             # Confirm replacement
             if not messagebox.askyesno("Confirm Replace All", 
                                        f"Replace {count} occurrences of '{find_text}' with '{replace_text}'?"):
@@ -261,16 +360,16 @@ class FindReplaceDialog(ctk.CTkToplevel):
             
             # Get the dataframe
             df = self.data_tab.df
-            case_sensitive = self.case_sensitive.get()
             
-            # Perform all replacements
-            import re
-            for row_idx, col_name, cell_value in self.matches:
-                if case_sensitive:
-                    new_value = cell_value.replace(find_text, replace_text)
-                else:
-                    new_value = re.sub(re.escape(find_text), replace_text, cell_value, flags=re.IGNORECASE)
-                df.at[row_idx, col_name] = new_value
+            # Replace within each column's matched cells in one assignment
+            # (matches are numbered in display order)
+            for col_pos in np.unique(cols):
+                col_rows = rows[cols == col_pos]
+                new_values = self._replace_texts(
+                    pd.Series(texts[col_pos][col_rows], dtype=object), find_text, replace_text
+                )
+                df.loc[self.data_tab.get_row_positions(col_rows), columns[col_pos]] = \
+                    new_values.to_numpy()
             
             # Mark as modified
             self.data_tab.modified = True
@@ -7,20 +7,28 @@ Dialog for converting Stata .dta files to DBF or other formats.
 """
 
 import os
-import tempfile
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
+from ..utils.background import run_in_background
+from ..utils.dbf_writer import DBFField, write_dbf
+from ..utils.dtypes import PYARROW_SUPPORT
+from ..utils.fonts import heading_font, title_font
+from ..utils.optional import has_module, load_pyreadstat
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Check for Stata support
-STATA_SUPPORT = True
-try:
-    import pyreadstat
-except ImportError:
-    STATA_SUPPORT = False
+# Check for Stata support; pyreadstat itself is imported on first use
+STATA_SUPPORT = has_module('pyreadstat')
+
+# Output formats for "Convert and save": extension and file dialog label.
+# Feather and Parquet keep the original column types and need pyarrow.
+OUTPUT_FORMATS = {
+    "DBF": (".dbf", "DBF files"),
+    "Feather": (".feather", "Feather files"),
+    "Parquet": (".parquet", "Parquet files"),
+}
 
 
 class StataConversionDialog(ctk.CTkToplevel):
@@ -30,9 +38,12 @@ class StataConversionDialog(ctk.CTkToplevel):
         super().__init__(parent)
         self.parent = parent
         self.dta_file_path = dta_file_path
+        # Cache file name and size for the info text; size is read on first use
+        self._file_base = os.path.basename(dta_file_path)
+        self._file_size = None
         
         self.title("Stata File Conversion")
-        self.geometry("600x500")
+        self.geometry("600x540")
         self.transient(parent)
         self.grab_set()
         
@@ -50,7 +61,7 @@ class StataConversionDialog(ctk.CTkToplevel):
         
         # Title
         title_label = ctk.CTkLabel(main_frame, text="Stata File Conversion", 
-                                  font=ctk.CTkFont(size=20, weight="bold"))
+                                  font=title_font())
         title_label.pack(pady=(0, 20))
         
         # File info frame
@@ -58,9 +69,10 @@ class StataConversionDialog(ctk.CTkToplevel):
         info_frame.pack(fill="x", pady=10)
         
         ctk.CTkLabel(info_frame, text="File Information:", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", padx=10, pady=5)
+                    font=heading_font()).pack(anchor="w", padx=10, pady=5)
         
-        self.info_text = ctk.CTkTextbox(info_frame, height=150)
+        self.info_text = ctk.CTkTextbox(info_frame, height=150, wrap="none",
+                                        state="disabled")
         self.info_text.pack(fill="x", padx=10, pady=5)
         
         # Conversion options frame
@@ -68,7 +80,7 @@ class StataConversionDialog(ctk.CTkToplevel):
         options_frame.pack(fill="x", pady=10)
         
         ctk.CTkLabel(options_frame, text="Conversion Options:", 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", padx=10, pady=5)
+                    font=heading_font()).pack(anchor="w", padx=10, pady=5)
         
         # Conversion type selection
         conversion_frame = ctk.CTkFrame(options_frame)
@@ -85,6 +97,17 @@ class StataConversionDialog(ctk.CTkToplevel):
         ctk.CTkRadioButton(conversion_frame, text="Import into existing DBF file",
                           variable=self.conversion_type, value="import_existing").pack(anchor="w", padx=5, pady=5)
         
+        # Output format for "Convert and save"
+        format_frame = ctk.CTkFrame(options_frame)
+        format_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(format_frame, text="Save as:").pack(side="left", padx=5, pady=2)
+        
+        self.output_format = ctk.StringVar(value="DBF")
+        formats = list(OUTPUT_FORMATS) if PYARROW_SUPPORT else ["DBF"]
+        ctk.CTkOptionMenu(format_frame, variable=self.output_format,
+                          values=formats).pack(side="left", padx=5, pady=2)
+        
         # Options for field type mapping
         mapping_frame = ctk.CTkFrame(options_frame)
         mapping_frame.pack(fill="x", padx=10, pady=5)
@@ -105,48 +128,67 @@ class StataConversionDialog(ctk.CTkToplevel):
         
         ctk.CTkButton(buttons_frame, text="Preview Data", 
                      command=self.preview_data).pack(side="left", padx=5)
-        ctk.CTkButton(buttons_frame, text="Convert", 
-                     command=self.convert_file).pack(side="left", padx=5)
+        self.convert_button = ctk.CTkButton(buttons_frame, text="Convert", 
+                                            command=self.convert_file)
+        self.convert_button.pack(side="left", padx=5)
         ctk.CTkButton(buttons_frame, text="Cancel", 
                      command=self.destroy).pack(side="right", padx=5)
     
     def load_dta_info(self):
-        """Load Stata file information"""
+        """Load Stata file information on a background thread"""
         if not STATA_SUPPORT:
-            self.info_text.insert("1.0", "Error: pyreadstat library not available.\nPlease install it with: pip install pyreadstat")
+            self._set_info("Error: pyreadstat library not available.\nPlease install it with: pip install pyreadstat")
             return
         
-        try:
-            # Read the Stata file with metadata
-            self.df, self.meta = pyreadstat.read_dta(self.dta_file_path)
-            
-            # Display file information
-            info = f"""File: {os.path.basename(self.dta_file_path)}
-Size: {os.path.getsize(self.dta_file_path):,} bytes
-Records: {len(self.df):,}
-Columns: {len(self.df.columns)}
-
-Column Information:
-{'-'*50}
-"""
-            
-            for col in self.df.columns:
-                dtype = str(self.df[col].dtype)
-                info += f"{col:<20} {dtype:<15}\n"
-            
-            if self.meta and hasattr(self.meta, 'column_labels'):
-                info += "\nColumn Labels:\n" + "-"*50 + "\n"
-                for col, label in self.meta.column_labels.items():
-                    if label:
-                        info += f"{col:<20} {label}\n"
-            
-            self.info_text.delete("1.0", "end")
-            self.info_text.insert("1.0", info)
-            
-        except Exception as e:
-            error_msg = f"Error loading Stata file: {str(e)}\n\nPossible solutions:\n• Install pyreadstat: pip install pyreadstat\n• Check if file is corrupted\n• Ensure file is a valid Stata .dta file"
-            self.info_text.delete("1.0", "end")
-            self.info_text.insert("1.0", error_msg)
+        self._set_info("Loading…")
+        run_in_background(self, self._bg_load,
+                          lambda result: self._apply_info(*result),
+                          self._on_load_error)
+    
+    def _bg_load(self):
+        """Read the Stata file and build its summary (runs on the I/O pool)"""
+        df, meta = load_pyreadstat().read_dta(self.dta_file_path)
+        return df, meta, self.build_info(df, meta)
+    
+    def _on_load_error(self, e: Exception):
+        """Show why the Stata file could not be loaded"""
+        error_msg = f"Error loading Stata file: {str(e)}\n\nPossible solutions:\n• Install pyreadstat: pip install pyreadstat\n• Check if file is corrupted\n• Ensure file is a valid Stata .dta file"
+        self._apply_info(None, None, error_msg)
+    
+    def _set_info(self, text: str):
+        """Replace the read-only info pane text in a single insert"""
+        self.info_text.configure(state="normal")
+        self.info_text.delete("1.0", "end")
+        self.info_text.insert("1.0", text)
+        self.info_text.configure(state="disabled")
+    
+    def _apply_info(self, df, meta, info: str):
+        """Store loaded data and show its summary (runs on the UI thread)"""
+        self.df = df
+        self.meta = meta
+        self._set_info(info)
+    
+    def build_info(self, df: pd.DataFrame, meta) -> str:
+        """Build the file information text"""
+        if self._file_size is None:
+            self._file_size = os.path.getsize(self.dta_file_path)
+        
+        parts = [
+            f"File: {self._file_base}",
+            f"Size: {self._file_size:,} bytes",
+            f"Records: {len(df):,}",
+            f"Columns: {len(df.columns)}",
+            "",
+            "Column Information:",
+            "-" * 50,
+        ]
+        parts.extend(f"{col:<20} {str(df[col].dtype):<15}" for col in df.columns)
+        
+        if meta and hasattr(meta, 'column_labels'):
+            parts.extend(["", "Column Labels:", "-" * 50])
+            parts.extend(f"{col:<20} {label}" for col, label in meta.column_labels.items() if label)
+        
+        return "\n".join(parts) + "\n"
     
     def preview_data(self):
         """Preview the data in a separate window"""
@@ -189,52 +231,78 @@ Column Information:
                 self.import_to_existing()
                 
         except Exception as e:
-            messagebox.showerror("Conversion Error", f"Failed to convert file: {str(e)}")
-            logger.error(f"Stata conversion failed: {str(e)}")
+            self._on_convert_error(e)
+    
+    def _on_convert_error(self, e: Exception):
+        """Report a failed conversion and allow another attempt"""
+        self.convert_button.configure(state="normal")
+        messagebox.showerror("Conversion Error", f"Failed to convert file: {str(e)}")
+        logger.error(f"Stata conversion failed: {str(e)}")
+    
+    def _write_in_background(self, write, on_done):
+        """Run write on the I/O pool, then call on_done on the UI thread"""
+        self.convert_button.configure(state="disabled")
+        run_in_background(self, write, lambda _: on_done(), self._on_convert_error)
     
     def open_directly(self):
         """Open Stata data directly in the application"""
-        # Convert DataFrame to DBF-compatible format
-        converted_df = self.prepare_dataframe_for_dbf(self.df)
-        
-        # Create temporary DBF file
-        temp_dir = tempfile.gettempdir()
-        temp_dbf_path = os.path.join(temp_dir, f"{os.path.splitext(os.path.basename(self.dta_file_path))[0]}.dbf")
+        # Hand the loaded DataFrame to a new tab instead of writing a DBF
+        # and reading it back; saving the tab asks where to write the DBF,
+        # suggesting a name next to the Stata file
+        dbf_path = f"{os.path.splitext(self.dta_file_path)[0]}.dbf"
         
-        # Create DBF file
-        self.create_dbf_from_dataframe(converted_df, temp_dbf_path)
-        
-        # Open in main application
-        self.parent.open_dbf_file(temp_dbf_path, read_only=False)
+        self.parent.open_dataframe(self.df, dbf_path, read_only=False)
         
-        messagebox.showinfo("Success", f"Stata file opened successfully!\nTemporary DBF created at: {temp_dbf_path}")
+        messagebox.showinfo("Success", "Stata file opened successfully!\nSave the tab to choose where the DBF is written.")
         self.destroy()
     
     def convert_and_save(self):
-        """Convert Stata file to DBF and save"""
+        """Convert Stata file to the selected format and save"""
+        output_format = self.output_format.get()
+        extension, label = OUTPUT_FORMATS[output_format]
+        
         # Ask user for save location
-        dbf_path = filedialog.asksaveasfilename(
-            title="Save DBF File",
-            defaultextension=".dbf",
-            filetypes=[("DBF files", "*.dbf"), ("All files", "*.*")],
-            initialvalue=f"{os.path.splitext(os.path.basename(self.dta_file_path))[0]}.dbf"
+        save_path = filedialog.asksaveasfilename(
+            title=f"Save {output_format} File",
+            defaultextension=extension,
+            filetypes=[(label, f"*{extension}"), ("All files", "*.*")],
+            initialvalue=f"{os.path.splitext(self._file_base)[0]}{extension}"
         )
         
-        if not dbf_path:
+        if not save_path:
+            return
+        
+        if output_format != "DBF":
+            # Arrow formats store the frame as-is, no DBF type coercion
+            df = self.df
+            if output_format == "Feather":
+                write = lambda: df.to_feather(save_path, compression='zstd')
+            else:
+                write = lambda: df.to_parquet(save_path, engine='pyarrow',
+                                              compression='zstd', index=False)
+            
+            def on_saved():
+                messagebox.showinfo("Conversion Complete",
+                                    f"{output_format} file created successfully at:\n{save_path}")
+                self.destroy()
+            
+            self._write_in_background(write, on_saved)
             return
         
         # Convert DataFrame to DBF-compatible format
         converted_df = self.prepare_dataframe_for_dbf(self.df)
         
-        # Create DBF file
-        self.create_dbf_from_dataframe(converted_df, dbf_path)
-        
-        # Ask if user wants to open the converted file
-        if messagebox.askyesno("Conversion Complete", 
-                              f"DBF file created successfully at:\n{dbf_path}\n\nWould you like to open it now?"):
-            self.parent.open_dbf_file(dbf_path, read_only=False)
+        def on_done():
+            # Ask if user wants to open the converted file
+            if messagebox.askyesno("Conversion Complete", 
+                                  f"DBF file created successfully at:\n{save_path}\n\nWould you like to open it now?"):
+                self.parent.open_dbf_file(save_path, read_only=False)
+            
+            self.destroy()
         
-        self.destroy()
+        # Create DBF file
+        self._write_in_background(
+            lambda: self.create_dbf_from_dataframe(converted_df, save_path), on_done)
     
     def import_to_existing(self):
         """Import Stata data into existing DBF file"""
@@ -255,42 +323,47 @@ Column Information:
     
     def prepare_dataframe_for_dbf(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prepare DataFrame for DBF conversion"""
-        converted_df = df.copy()
+        if not len(df.columns):
+            return df
         
-        # Handle missing values if requested
-        if self.handle_missing.get():
-            converted_df = converted_df.fillna('')
+        handle_missing = self.handle_missing.get()
         
-        # Convert data types for DBF compatibility
-        for col in converted_df.columns:
-            dtype = converted_df[col].dtype
+        # Convert each column for DBF compatibility, then build the new frame
+        # in one step instead of replacing columns of a copy one by one
+        converted = {}
+        for col, values in df.items():
+            dtype = values.dtype
             
             # Convert datetime to string format
             if pd.api.types.is_datetime64_any_dtype(dtype):
-                converted_df[col] = converted_df[col].dt.strftime('%Y%m%d')
+                values = values.dt.strftime('%Y%m%d')
+                if handle_missing:
+                    values = values.fillna('')
             
             # Convert boolean to string
-            elif dtype == 'bool':
-                converted_df[col] = converted_df[col].map({True: 'T', False: 'F', pd.NA: ''})
-            
-            # Handle object/string columns - truncate if too long
-            elif dtype == 'object':
-                # Convert to string and limit length to 254 characters (DBF limit)
-                converted_df[col] = converted_df[col].astype(str).str[:254]
+            elif pd.api.types.is_bool_dtype(dtype):
+                values = values.map({True: 'T', False: 'F'})
             
-            # Handle numeric columns
+            # Handle numeric columns; missing numbers are written as blank fields
             elif pd.api.types.is_numeric_dtype(dtype):
                 # Keep as is, but handle infinities
-                converted_df[col] = converted_df[col].replace([float('inf'), float('-inf')], 0)
+                values = values.replace([float('inf'), float('-inf')], 0)
+            
+            # Text and anything else (e.g. labelled categories) - truncate if too long
+            else:
+                if handle_missing:
+                    values = values.astype(object).fillna('')
+                # Convert to string and limit length to 254 characters (DBF limit)
+                values = values.astype(str).str.slice(0, 254)
+            
+            converted[col] = values
         
-        return converted_df
+        return pd.concat(converted, axis=1)
     
     def create_dbf_from_dataframe(self, df: pd.DataFrame, dbf_path: str):
         """Create DBF file from DataFrame"""
-        import dbf
-        
         # Determine field specifications
-        field_specs = []
+        fields = []
         for col in df.columns:
             # Clean column name for DBF (max 10 chars, no spaces)
             clean_name = col.replace(' ', '_')[:10].upper()
@@ -300,32 +373,18 @@ Column Information:
             
             if pd.api.types.is_numeric_dtype(dtype):
                 if pd.api.types.is_integer_dtype(dtype):
-                    field_specs.append(f"{clean_name} N(12,0)")
+                    fields.append(DBFField(clean_name, 'N', 12, 0))
                 else:
-                    field_specs.append(f"{clean_name} N(12,2)")
+                    fields.append(DBFField(clean_name, 'N', 12, 2))
             else:
                 # String field - determine max length
-                max_len = min(df[col].astype(str).str.len().max() or 10, 254)
+                longest = df[col].astype(str).str.len().max() if len(df) else 0
+                max_len = min(int(longest) or 10, 254)
                 max_len = max(max_len, 1)  # Minimum length of 1
-                field_specs.append(f"{clean_name} C({max_len})")
+                fields.append(DBFField(clean_name, 'C', max_len))
         
-        # Create DBF table
-        table = dbf.Table(dbf_path, '; '.join(field_specs))
-        table.open(mode=dbf.READ_WRITE)
-        
-        try:
-            # Add records
-            for _, row in df.iterrows():
-                record = table.new()
-                for i, (col, value) in enumerate(row.items()):
-                    field_name = list(table.field_names)[i]
-                    if pd.isna(value) or value == '':
-                        setattr(record, field_name, '')
-                    else:
-                        setattr(record, field_name, value)
-                record.write_record()
-        
-        finally:
-            table.close()
+        # Records are formatted a column at a time and written in one go;
+        # missing values are left blank
+        write_dbf(df, dbf_path, fields)
         
         logger.info(f"DBF file created: {dbf_path} with {len(df)} records")
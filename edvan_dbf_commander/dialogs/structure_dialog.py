@@ -9,6 +9,7 @@ Allows editing DBF file structure including adding, removing, and reordering fie
 import os
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
+from ..utils.fonts import title_font
 from dbfpy3 import dbf
 import logging
 
@@ -23,6 +24,7 @@ class DBFStructureDialog(ctk.CTkToplevel):
         self.parent = parent
         self.dbf_file_path = dbf_file_path
         self.fields_data = []
+        self._row_widgets = []  # Pooled row frames, one per field index
         
         self.title("DBF Structure Editor")
         self.geometry("800x600")
@@ -41,7 +43,7 @@ class DBFStructureDialog(ctk.CTkToplevel):
         
         # Title
         title_label = ctk.CTkLabel(main_frame, text="DBF Structure Editor", 
-                                  font=ctk.CTkFont(size=20, weight="bold"))
+                                  font=title_font())
         title_label.pack(pady=(0, 20))
         
         # Fields frame
@@ -87,45 +89,43 @@ class DBFStructureDialog(ctk.CTkToplevel):
                         'length': field.length,
                         'decimals': field.decimal_count
                     })
-                self.refresh_fields_display()
+                self.sync_fields_display()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load structure: {str(e)}")
     
-    def refresh_fields_display(self):
-        """Refresh the fields display"""
-        # Clear existing widgets
-        for widget in self.fields_tree.winfo_children()[1:]:  # Skip header
-            widget.destroy()
-        
-        # Add field rows
-        for i, field in enumerate(self.fields_data):
-            self.create_field_row(i, field)
+    def sync_fields_display(self, start: int = 0):
+        """Sync the pooled field rows with fields_data from the given index on"""
+        # Grow or shrink the pool at the tail only
+        while len(self._row_widgets) < len(self.fields_data):
+            self._row_widgets.append(self.create_field_row(len(self._row_widgets)))
+        while len(self._row_widgets) > len(self.fields_data):
+            self._row_widgets.pop().destroy()
+        
+        # Overwrite row contents in place
+        for i in range(start, len(self.fields_data)):
+            self._apply_field(self._row_widgets[i], self.fields_data[i])
     
-    def create_field_row(self, index: int, field: dict):
-        """Create a row for a field"""
+    def create_field_row(self, index: int):
+        """Create an empty row for the field at the given index"""
         row_frame = ctk.CTkFrame(self.fields_tree)
         row_frame.pack(fill="x", pady=2)
         
         # Field name
         name_entry = ctk.CTkEntry(row_frame, width=150)
         name_entry.pack(side="left", padx=5)
-        name_entry.insert(0, field['name'])
         
         # Field type
         type_combo = ctk.CTkComboBox(row_frame, width=80, 
                                     values=["C", "N", "L", "D", "M"])
         type_combo.pack(side="left", padx=5)
-        type_combo.set(field['type'])
         
         # Length
         length_entry = ctk.CTkEntry(row_frame, width=80)
         length_entry.pack(side="left", padx=5)
-        length_entry.insert(0, str(field['length']))
         
         # Decimals
         decimals_entry = ctk.CTkEntry(row_frame, width=80)
         decimals_entry.pack(side="left", padx=5)
-        decimals_entry.insert(0, str(field['decimals']))
         
         # Actions
         actions_frame = ctk.CTkFrame(row_frame, width=120)
@@ -143,6 +143,16 @@ class DBFStructureDialog(ctk.CTkToplevel):
         setattr(row_frame, 'type_combo', type_combo)
         setattr(row_frame, 'length_entry', length_entry)
         setattr(row_frame, 'decimals_entry', decimals_entry)
+        return row_frame
+    
+    def _apply_field(self, row_frame, field: dict):
+        """Write a field's values into an existing row"""
+        for entry, value in ((row_frame.name_entry, field['name']),
+                             (row_frame.length_entry, field['length']),
+                             (row_frame.decimals_entry, field['decimals'])):
+            entry.delete(0, "end")
+            entry.insert(0, str(value))
+        row_frame.type_combo.set(field['type'])
     
     def add_field(self):
         """Add a new field"""
@@ -153,27 +163,32 @@ class DBFStructureDialog(ctk.CTkToplevel):
             'decimals': 0
         }
         self.fields_data.append(new_field)
-        self.refresh_fields_display()
+        self.sync_fields_display(len(self.fields_data) - 1)
     
     def delete_field(self, index: int):
         """Delete a field"""
         if 0 <= index < len(self.fields_data):
             del self.fields_data[index]
-            self.refresh_fields_display()
+            self.sync_fields_display(index)
     
     def move_field_up(self, index: int):
         """Move field up"""
         if index > 0:
             self.fields_data[index], self.fields_data[index-1] = \
                 self.fields_data[index-1], self.fields_data[index]
-            self.refresh_fields_display()
+            self._swap_rows(index - 1, index)
     
     def move_field_down(self, index: int):
         """Move field down"""
         if index < len(self.fields_data) - 1:
             self.fields_data[index], self.fields_data[index+1] = \
                 self.fields_data[index+1], self.fields_data[index]
-            self.refresh_fields_display()
+            self._swap_rows(index, index + 1)
+    
+    def _swap_rows(self, first: int, second: int):
+        """Redraw only the two rows affected by a move"""
+        self._apply_field(self._row_widgets[first], self.fields_data[first])
+        self._apply_field(self._row_widgets[second], self.fields_data[second])
     
     def save_structure(self):
         """Save the current structure"""
@@ -190,17 +205,15 @@ class DBFStructureDialog(ctk.CTkToplevel):
     
     def extract_fields_data(self):
         """Extract field data from UI elements"""
-        extracted_data = []
-        for widget in self.fields_tree.winfo_children()[1:]:  # Skip header
-            if hasattr(widget, 'name_entry'):
-                field_data = {
-                    'name': widget.name_entry.get(),
-                    'type': widget.type_combo.get(),
-                    'length': int(widget.length_entry.get() or 0),
-                    'decimals': int(widget.decimals_entry.get() or 0)
-                }
-                extracted_data.append(field_data)
-        self.fields_data = extracted_data
+        self.fields_data = [
+            {
+                'name': row.name_entry.get(),
+                'type': row.type_combo.get(),
+                'length': int(row.length_entry.get() or 0),
+                'decimals': int(row.decimals_entry.get() or 0)
+            }
+            for row in self._row_widgets
+        ]
     
     def export_structure(self):
         """Export structure to text file"""
@@ -10,41 +10,159 @@ This is the main application class with menu system and tab management.
 import os
 import sys
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from tkinter import messagebox, filedialog
 import tkinter as tk
 import customtkinter as ctk
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import local modules
-from .dialogs import (
-    DBFStructureDialog,
-    FindReplaceDialog,
-    CSVConversionDialog,
-    StataConversionDialog
-)
-from .tabs import DBFDataTab, DTADataTab
-from .utils import (
+# Import local modules; tabs, dialogs and import/export pull in pandas and
+# are imported where they are first used, after the main window is shown
+from .utils.encoding import (
     convert_ansi_to_oem,
     convert_oem_to_ansi,
     convert_ansi_to_utf8,
-    convert_utf8_to_ansi,
-    import_csv_to_dbf,
-    import_xml_to_dbf,
-    cleanup_temp_files
+    convert_utf8_to_ansi
+)
+from .utils.fonts import get_font
+from .utils.optional import has_module
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Status bar updates within this window are shown as one
+STATUS_DELAY_MS = 50
+
+# Feature list shown on the welcome screen
+WELCOME_FEATURES = (
+    "• Tabbed interface for multiple files",
+    "• Structure editor with field management",
+    "• SQL query support",
+    "• Data filtering and sorting",
+    "• Import/Export (CSV, XML, Excel, HTML)",
+    "• Find & Replace functionality",
+    "• Encoding conversion support",
+    "• Backup and read-only modes"
+)
+
+
+# Page around the table written by Export to HTML
+HTML_EXPORT_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <title>DBF Data Export</title>
+    <style>
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <h1>DBF Data Export</h1>
+    """
+HTML_EXPORT_FOOTER = """
+</body>
+</html>
+"""
+
+# Text shown in the About dialog
+ABOUT_TEXT = """
+EDVAN DBF Commander v1.1
+
+A modern, feature-rich DBF file management application built with Python and CustomTkinter.
+
+Features:
+• Tabbed interface for multiple files
+• Structure editor with field management
+• SQL query support
+• Data filtering and sorting
+• Import/Export (CSV, XML, Excel, HTML)
+• Find & Replace functionality
+• Encoding conversion support
+• Backup and read-only modes
+
+Built with:
+• Python 3
+• CustomTkinter
+• dbfpy3
+• pandas
+• openpyxl
+
+© 2026 EDVAN DBF Commander
+"""
+
+# Menu bar layout: (label, method name[, accelerator]) for commands,
+# (label, entries) for cascades and None for separators
+MENU_SPEC = (
+    ("File", (
+        ("New DBF...", "create_new_file", "Ctrl+N"),
+        ("Open...", "open_file", "Ctrl+O"),
+        ("Open Read-Only...", "open_readonly_file"),
+        None,
+        ("Open Stata File (.dta)...", "open_dta_file"),
+        ("Convert Stata to DBF...", "convert_dta_to_dbf"),
+        ("Convert Stata to CSV...", "convert_dta_to_csv"),
+        None,
+        ("Convert DBF to CSV...", "convert_dbf_to_csv"),
+        ("Close Tab", "close_current_tab", "Ctrl+W"),
+        ("Close All", "close_all_tabs"),
+        None,
+        ("Backup Current File", "backup_current_file", "Ctrl+B"),
+        None,
+        ("Exit", "quit", "Ctrl+Q"),
+    )),
+    ("Edit", (
+        ("Find & Replace...", "open_find_replace", "Ctrl+F"),
+        None,
+        ("Structure Editor...", "open_structure_editor"),
+    )),
+    ("Data", (
+        ("Clear Filter", "clear_filter"),
+        None,
+        ("Import", (
+            ("From CSV...", "import_from_csv"),
+            ("From XML...", "import_from_xml"),
+        )),
+        ("Export", (
+            ("To CSV...", "export_to_csv"),
+            ("To XML...", "export_to_xml"),
+            ("To Excel...", "export_to_excel"),
+            ("To HTML...", "export_to_html"),
+        )),
+        ("Convert Encoding", (
+            ("Windows (ANSI) → MS-DOS (OEM)", "convert_ansi_to_oem"),
+            ("MS-DOS (OEM) → Windows (ANSI)", "convert_oem_to_ansi"),
+            None,
+            ("Windows (ANSI) → UTF-8", "convert_ansi_to_utf8"),
+            ("UTF-8 → Windows (ANSI)", "convert_utf8_to_ansi"),
+        )),
+    )),
+    ("Help", (
+        ("About...", "show_about"),
+    )),
 )
 
-# Check for Stata support
-STATA_SUPPORT = True
-try:
-    import pyreadstat
-except ImportError:
-    STATA_SUPPORT = False
-    logger.info("pyreadstat not available - Stata .dta support disabled")
+# Menu commands that need pyreadstat
+STATA_COMMANDS = {'open_dta_file', 'convert_dta_to_dbf', 'convert_dta_to_csv'}
+
+
+def _accelerator_event(accelerator: str) -> str:
+    """Tk event sequence for a menu accelerator such as 'Ctrl+N'"""
+    modifier, key = accelerator.rsplit('+', 1)
+    return f"<{modifier.replace('Ctrl', 'Control')}-{key.lower()}>"
+
+
+@lru_cache(maxsize=None)
+def _has_stata() -> bool:
+    """Check for Stata support without importing pyreadstat"""
+    if not has_module('pyreadstat'):
+        logger.info("pyreadstat not available - Stata .dta support disabled")
+        return False
+    return True
 
 # Set CustomTkinter appearance
 ctk.set_appearance_mode("dark")
@@ -65,12 +183,24 @@ class EDVANDBFCommander(ctk.CTk):
         # Track open files
         self.open_files = {}
         
-        # Cleanup old temp files on startup
-        cleanup_temp_files(max_age_hours=24)
+        # About dialog, created when first shown
+        self._about_window = None
+        
+        # Latest status message waiting to be shown
+        self._pending_status = None
+        self._status_after_id = None
         
         # Setup UI
         self.setup_ui()
         self.create_menu()
+        
+        # Cleanup old temp files once the window is up
+        self.after(500, self._cleanup_temp_files)
+    
+    def _cleanup_temp_files(self):
+        """Remove stale temp files left by earlier sessions"""
+        from .utils.import_export import cleanup_temp_files
+        cleanup_temp_files(max_age_hours=24)
     
     def setup_ui(self):
         """Setup the main user interface"""
@@ -104,21 +234,21 @@ class EDVANDBFCommander(ctk.CTk):
             
             ctk.CTkLabel(welcome_content, 
                         text="Welcome to EDVAN DBF Commander",
-                        font=ctk.CTkFont(size=32, weight="bold")).pack(pady=20)
+                        font=get_font(32, "bold")).pack(pady=20)
             
             ctk.CTkLabel(welcome_content,
                         text="Modern DBF File Management Tool v1.1",
-                        font=ctk.CTkFont(size=16)).pack(pady=10)
+                        font=get_font(16)).pack(pady=10)
             
             buttons_frame = ctk.CTkFrame(welcome_content)
             buttons_frame.pack(pady=30)
             
             ctk.CTkButton(buttons_frame, text="Open DBF File", 
-                         font=ctk.CTkFont(size=14),
+                         font=get_font(14),
                          command=self.open_file).pack(side="left", padx=10)
             
             ctk.CTkButton(buttons_frame, text="Create New DBF", 
-                         font=ctk.CTkFont(size=14),
+                         font=get_font(14),
                          command=self.create_new_file).pack(side="left", padx=10)
             
             # Features list
@@ -126,113 +256,97 @@ class EDVANDBFCommander(ctk.CTk):
             features_frame.pack(pady=20, fill="x")
             
             ctk.CTkLabel(features_frame, text="Features:", 
-                        font=ctk.CTkFont(size=18, weight="bold")).pack(pady=5)
+                        font=get_font(18, "bold")).pack(pady=5)
             
-            features = [
-                "• Tabbed interface for multiple files",
-                "• Structure editor with field management",
-                "• SQL query support",
-                "• Data filtering and sorting",
-                "• Import/Export (CSV, XML, Excel, HTML)",
-                "• Find & Replace functionality",
-                "• Encoding conversion support",
-                "• Backup and read-only modes"
-            ]
-            
-            for feature in features:
-                ctk.CTkLabel(features_frame, text=feature, anchor="w").pack(anchor="w", padx=20, pady=2)
+            # One multi-line label instead of a widget per feature
+            ctk.CTkLabel(features_frame, text="\n".join(WELCOME_FEATURES),
+                        anchor="w", justify="left").pack(anchor="w", padx=20, pady=2)
     
     def create_menu(self):
-        """Create the application menu"""
-        # Create menu bar
+        """Create the application menu and keyboard shortcuts from MENU_SPEC"""
         menubar = tk.Menu(self)
         self.configure(menu=menubar)
-        
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="New DBF...", command=self.create_new_file, accelerator="Ctrl+N")
-        file_menu.add_command(label="Open...", command=self.open_file, accelerator="Ctrl+O")
-        file_menu.add_command(label="Open Read-Only...", command=self.open_readonly_file)
-        file_menu.add_separator()
-        
-        # Stata DTA file support
-        if STATA_SUPPORT:
-            file_menu.add_command(label="Open Stata File (.dta)...", command=self.open_dta_file)
-            file_menu.add_command(label="Convert Stata to DBF...", command=self.convert_dta_to_dbf)
-            file_menu.add_command(label="Convert Stata to CSV...", command=self.convert_dta_to_csv)
-        file_menu.add_separator()
-        
-        # Direct CSV conversion
-        file_menu.add_command(label="Convert DBF to CSV...", command=self.convert_dbf_to_csv)
-        file_menu.add_command(label="Close Tab", command=self.close_current_tab, accelerator="Ctrl+W")
-        file_menu.add_command(label="Close All", command=self.close_all_tabs)
-        file_menu.add_separator()
-        file_menu.add_command(label="Backup Current File", command=self.backup_current_file, accelerator="Ctrl+B")
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit, accelerator="Ctrl+Q")
-        
-        # Edit menu
-        edit_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Edit", menu=edit_menu)
-        edit_menu.add_command(label="Find & Replace...", command=self.open_find_replace, accelerator="Ctrl+F")
-        edit_menu.add_separator()
-        edit_menu.add_command(label="Structure Editor...", command=self.open_structure_editor)
-        
-        # Data menu
-        data_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Data", menu=data_menu)
-        data_menu.add_command(label="Clear Filter", command=self.clear_filter)
-        data_menu.add_separator()
-        
-        # Import submenu
-        import_menu = tk.Menu(data_menu, tearoff=0)
-        data_menu.add_cascade(label="Import", menu=import_menu)
-        import_menu.add_command(label="From CSV...", command=self.import_from_csv)
-        import_menu.add_command(label="From XML...", command=self.import_from_xml)
-        
-        # Export submenu
-        export_menu = tk.Menu(data_menu, tearoff=0)
-        data_menu.add_cascade(label="Export", menu=export_menu)
-        export_menu.add_command(label="To CSV...", command=self.export_to_csv)
-        export_menu.add_command(label="To XML...", command=self.export_to_xml)
-        export_menu.add_command(label="To Excel...", command=self.export_to_excel)
-        export_menu.add_command(label="To HTML...", command=self.export_to_html)
-        
-        # Encoding submenu
-        encoding_menu = tk.Menu(data_menu, tearoff=0)
-        data_menu.add_cascade(label="Convert Encoding", menu=encoding_menu)
-        encoding_menu.add_command(label="Windows (ANSI) → MS-DOS (OEM)", command=self.convert_ansi_to_oem)
-        encoding_menu.add_command(label="MS-DOS (OEM) → Windows (ANSI)", command=self.convert_oem_to_ansi)
-        encoding_menu.add_separator()
-        encoding_menu.add_command(label="Windows (ANSI) → UTF-8", command=self.convert_ansi_to_utf8)
-        encoding_menu.add_command(label="UTF-8 → Windows (ANSI)", command=self.convert_utf8_to_ansi)
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About...", command=self.show_about)
-        
-        # Bind keyboard shortcuts
-        self.bind('<Control-n>', lambda e: self.create_new_file())
-        self.bind('<Control-o>', lambda e: self.open_file())
-        self.bind('<Control-w>', lambda e: self.close_current_tab())
-        self.bind('<Control-b>', lambda e: self.backup_current_file())
-        self.bind('<Control-f>', lambda e: self.open_find_replace())
-        self.bind('<Control-q>', lambda e: self.quit())
+        self._build_menu(menubar, MENU_SPEC)
+    
+    def _build_menu(self, menu: tk.Menu, spec):
+        """Add the entries in spec to menu, binding any accelerators"""
+        for entry in spec:
+            if entry is None:
+                menu.add_separator()
+                continue
+            
+            label, target, *accelerator = entry
+            if isinstance(target, tuple):
+                submenu = tk.Menu(menu, tearoff=0)
+                menu.add_cascade(label=label, menu=submenu)
+                self._build_menu(submenu, target)
+                continue
+            
+            # Stata entries are left out when pyreadstat is missing
+            if target in STATA_COMMANDS and not _has_stata():
+                continue
+            
+            command = getattr(self, target)
+            if accelerator:
+                menu.add_command(label=label, command=command, accelerator=accelerator[0])
+                self.bind(_accelerator_event(accelerator[0]),
+                          lambda event, command=command: command())
+            else:
+                menu.add_command(label=label, command=command)
     
     def update_status(self, message: str):
-        """Update status bar message"""
-        self.status_label.configure(text=message)
+        """Update status bar message; bursts of updates are coalesced"""
+        self._pending_status = message
+        if self._status_after_id is None:
+            self._status_after_id = self.after(STATUS_DELAY_MS, self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest pending status message"""
+        if self._pending_status is not None:
+            self.status_label.configure(text=self._pending_status)
+        self._pending_status = None
+        self._status_after_id = None
     
     def get_current_tab(self):
         """Get the currently active data tab (DBFDataTab or DTADataTab)"""
         current_tab_name = self.notebook.get()
         if current_tab_name and current_tab_name != "Welcome":
             if current_tab_name in self.open_files:
-                return self.open_files[current_tab_name].get('tab')
+                return self._materialize_tab(current_tab_name)
         return None
     
+    def _add_lazy_tab(self, tab_name: str, factory, select: bool = True, **info):
+        """Add a notebook tab whose data tab is built when it is first shown"""
+        tab = self.notebook.add(tab_name)
+        self.open_files[tab_name] = dict(info, tab=None, factory=factory)
+        tab.bind("<Map>", lambda event: self._materialize_tab(tab_name), add="+")
+        if select:
+            self.notebook.set(tab_name)
+    
+    def _open_batch(self, file_paths, open_one):
+        """Open each selected file, switching only to the last one"""
+        for i, file_path in enumerate(file_paths):
+            open_one(file_path, select=(i == len(file_paths) - 1))
+    
+    def _materialize_tab(self, tab_name: str):
+        """Build and return the data tab for tab_name, creating it on first use"""
+        tab_info = self.open_files.get(tab_name)
+        if tab_info is None:
+            return None
+        
+        factory = tab_info.get('factory')
+        if factory is not None:
+            tab_info['factory'] = None
+            try:
+                data_tab = factory(self.notebook.tab(tab_name))
+                data_tab.pack(fill="both", expand=True)
+                tab_info['tab'] = data_tab
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open file: {str(e)}")
+                logger.error(f"Failed to open {tab_info['path']}: {str(e)}")
+        
+        return tab_info['tab']
+    
     def create_new_file(self):
         """Create a new DBF file"""
         file_path = filedialog.asksaveasfilename(
@@ -243,10 +357,11 @@ class EDVANDBFCommander(ctk.CTk):
         
         if file_path:
             try:
-                import dbf
-                table = dbf.Table(file_path, 'id N(10,0)')
-                table.open(mode=dbf.READ_WRITE)
-                table.close()
+                import pandas as pd
+                from .utils.dbf_writer import DBFField, write_dbf
+                
+                # Empty table with a single numeric ID field
+                write_dbf(pd.DataFrame({'ID': []}), file_path, [DBFField('ID', 'N', 10)])
                 
                 self.open_dbf_file(file_path, read_only=False)
                 self.update_status(f"Created new file: {os.path.basename(file_path)}")
@@ -256,28 +371,32 @@ class EDVANDBFCommander(ctk.CTk):
                 logger.error(f"Failed to create DBF file {file_path}: {str(e)}")
     
     def open_file(self):
-        """Open an existing DBF file"""
-        file_path = filedialog.askopenfilename(
+        """Open one or more existing DBF files"""
+        file_paths = filedialog.askopenfilenames(
             title="Open DBF File",
             filetypes=[("DBF files", "*.dbf"), ("All files", "*.*")]
         )
         
-        if file_path:
-            self.open_dbf_file(file_path, read_only=False)
+        self._open_batch(file_paths, self.open_dbf_file)
     
     def open_readonly_file(self):
-        """Open a DBF file in read-only mode"""
-        file_path = filedialog.askopenfilename(
+        """Open one or more DBF files in read-only mode"""
+        file_paths = filedialog.askopenfilenames(
             title="Open DBF File (Read-Only)",
             filetypes=[("DBF files", "*.dbf"), ("All files", "*.*")]
         )
         
-        if file_path:
-            self.open_dbf_file(file_path, read_only=True)
+        self._open_batch(
+            file_paths,
+            lambda file_path, select: self.open_dbf_file(file_path, read_only=True, select=select)
+        )
     
-    def open_dbf_file(self, file_path: str, read_only: bool = False):
-        """Open a DBF file in a new tab"""
+    def open_dbf_file(self, file_path: str, read_only: bool = False,
+                      df: 'pd.DataFrame' = None, select: bool = True):
+        """Open a DBF file in a new tab, or show df in place of reading it"""
         try:
+            from .tabs.dbf_data_tab import DBFDataTab
+            
             # Remove welcome tab if present
             if "Welcome" in self.notebook._tab_dict:
                 self.notebook.delete("Welcome")
@@ -289,26 +408,19 @@ class EDVANDBFCommander(ctk.CTk):
             # Check if file is already open
             if tab_name in self.open_files:
                 messagebox.showinfo("Already Open", f"File {file_name} is already open.")
-                self.notebook.set(tab_name)
+                if select:
+                    self.notebook.set(tab_name)
                 return
             
-            # Create tab
-            tab = self.notebook.add(tab_name)
-            
-            # Create data tab widget
-            data_tab = DBFDataTab(tab, file_path, read_only)
-            data_tab.pack(fill="both", expand=True)
-            
-            # Store reference
-            self.open_files[tab_name] = {
-                'path': file_path,
-                'read_only': read_only,
-                'tab': data_tab,
-                'type': 'dbf'
-            }
-            
-            # Switch to new tab
-            self.notebook.set(tab_name)
+            # Create tab and switch to it; the data tab is built when first shown
+            self._add_lazy_tab(
+                tab_name,
+                lambda parent: DBFDataTab(parent, file_path, read_only, df=df),
+                path=file_path,
+                read_only=read_only,
+                type='dbf',
+                select=select
+            )
             
             self.update_status(f"Opened: {file_name} {'(Read-Only)' if read_only else ''}")
             logger.info(f"Opened DBF file: {file_path} (read_only: {read_only})")
@@ -317,25 +429,30 @@ class EDVANDBFCommander(ctk.CTk):
             messagebox.showerror("Error", f"Failed to open file: {str(e)}")
             logger.error(f"Failed to open DBF file {file_path}: {str(e)}")
     
+    def open_dataframe(self, df: 'pd.DataFrame', file_path: str, read_only: bool = False):
+        """Open an in-memory DataFrame in a new DBF tab; file_path is where it saves"""
+        self.open_dbf_file(file_path, read_only, df=df)
+    
     def open_dta_file(self):
-        """Open a Stata DTA file"""
-        if not STATA_SUPPORT:
+        """Open one or more Stata DTA files"""
+        if not _has_stata():
             messagebox.showerror("Stata Support Not Available", 
                                "pyreadstat library is required for Stata file support.\n" +
                                "Please install it with: pip install pyreadstat")
             return
         
-        file_path = filedialog.askopenfilename(
+        file_paths = filedialog.askopenfilenames(
             title="Open Stata DTA File",
             filetypes=[("Stata files", "*.dta"), ("All files", "*.*")]
         )
         
-        if file_path:
-            self.open_stata_file(file_path)
+        self._open_batch(file_paths, self.open_stata_file)
     
-    def open_stata_file(self, file_path: str):
+    def open_stata_file(self, file_path: str, select: bool = True):
         """Open a Stata DTA file in a new tab"""
         try:
+            from .tabs.dta_data_tab import DTADataTab
+            
             # Remove welcome tab if present
             if "Welcome" in self.notebook._tab_dict:
                 self.notebook.delete("Welcome")
@@ -347,26 +464,19 @@ class EDVANDBFCommander(ctk.CTk):
             # Check if file is already open
             if tab_name in self.open_files:
                 messagebox.showinfo("Already Open", f"File {file_name} is already open.")
-                self.notebook.set(tab_name)
+                if select:
+                    self.notebook.set(tab_name)
                 return
             
-            # Create tab
-            tab = self.notebook.add(tab_name)
-            
-            # Create DTA data tab widget
-            data_tab = DTADataTab(tab, file_path, read_only=True)
-            data_tab.pack(fill="both", expand=True)
-            
-            # Store reference
-            self.open_files[tab_name] = {
-                'path': file_path,
-                'read_only': True,
-                'tab': data_tab,
-                'type': 'dta'
-            }
-            
-            # Switch to new tab
-            self.notebook.set(tab_name)
+            # Create tab and switch to it; the data tab is built when first shown
+            self._add_lazy_tab(
+                tab_name,
+                lambda parent: DTADataTab(parent, file_path, read_only=True),
+                path=file_path,
+                read_only=True,
+                type='dta',
+                select=select
+            )
             
             self.update_status(f"Opened Stata file: {file_name} (Read-Only)")
             logger.info(f"Opened Stata DTA file: {file_path}")
@@ -377,7 +487,7 @@ class EDVANDBFCommander(ctk.CTk):
     
     def convert_dta_to_dbf(self):
         """Convert a Stata DTA file to DBF"""
-        if not STATA_SUPPORT:
+        if not _has_stata():
             messagebox.showerror("Stata Support Not Available", 
                                "pyreadstat library is required for Stata file support.\n" +
                                "Please install it with: pip install pyreadstat")
@@ -389,11 +499,12 @@ class EDVANDBFCommander(ctk.CTk):
         )
         
         if file_path:
+            from .dialogs.stata_dialog import StataConversionDialog
             StataConversionDialog(self, file_path)
     
     def convert_dta_to_csv(self):
         """Convert a Stata DTA file to CSV"""
-        if not STATA_SUPPORT:
+        if not _has_stata():
             messagebox.showerror("Stata Support Not Available", 
                                "pyreadstat library is required for Stata file support.\n" +
                                "Please install it with: pip install pyreadstat")
@@ -405,6 +516,7 @@ class EDVANDBFCommander(ctk.CTk):
         )
         
         if file_path:
+            from .dialogs.csv_dialog import CSVConversionDialog
             CSVConversionDialog(self, file_path, "dta")
     
     def convert_dbf_to_csv(self):
@@ -415,6 +527,7 @@ class EDVANDBFCommander(ctk.CTk):
         )
         
         if file_path:
+            from .dialogs.csv_dialog import CSVConversionDialog
             CSVConversionDialog(self, file_path, "dbf")
     
     def close_current_tab(self):
@@ -431,12 +544,15 @@ class EDVANDBFCommander(ctk.CTk):
             self.notebook.delete(current_tab)
             
             # Show welcome message if no tabs remain
-            if len(self.notebook._tab_dict) == 0:
+            if not self.open_files:
                 self.show_welcome_message()
     
     def close_all_tabs(self):
         """Close all open tabs"""
-        for tab_name in list(self.open_files.keys()):
+        # Close the selected tab last, so the notebook does not switch to
+        # (and build) each remaining tab as the one in front is removed
+        current_tab = self.notebook.get()
+        for tab_name in sorted(self.open_files, key=lambda name: name == current_tab):
             tab_info = self.open_files[tab_name]
             if 'tab' in tab_info and hasattr(tab_info['tab'], 'cleanup'):
                 tab_info['tab'].cleanup()
@@ -444,11 +560,24 @@ class EDVANDBFCommander(ctk.CTk):
         self.open_files.clear()
         self.show_welcome_message()
     
+    def _require_saved_file(self, current_tab) -> bool:
+        """True once current_tab's file holds its data, offering to save it first"""
+        if not current_tab.file_pending:
+            return True
+        
+        # File actions would otherwise work on a file the data was never written to
+        if messagebox.askyesno("Save Required",
+                               "This data has not been saved to a DBF file yet.\n\n"
+                               "Save it now?"):
+            current_tab.save_changes()
+        return not current_tab.file_pending
+    
     def backup_current_file(self):
         """Backup the current file"""
         current_tab = self.get_current_tab()
         if current_tab:
-            current_tab.backup_file()
+            if self._require_saved_file(current_tab):
+                current_tab.backup_file()
         else:
             messagebox.showinfo("No File", "No file is currently open.")
     
@@ -456,6 +585,7 @@ class EDVANDBFCommander(ctk.CTk):
         """Open find and replace dialog"""
         current_tab = self.get_current_tab()
         if current_tab:
+            from .dialogs.find_replace_dialog import FindReplaceDialog
             FindReplaceDialog(self, current_tab)
         else:
             messagebox.showinfo("No File", "No file is currently open.")
@@ -464,6 +594,9 @@ class EDVANDBFCommander(ctk.CTk):
         """Open structure editor"""
         current_tab = self.get_current_tab()
         if current_tab:
+            if not self._require_saved_file(current_tab):
+                return
+            from .dialogs.structure_dialog import DBFStructureDialog
             DBFStructureDialog(self, current_tab.file_path)
         else:
             messagebox.showinfo("No File", "No file is currently open.")
@@ -487,12 +620,16 @@ class EDVANDBFCommander(ctk.CTk):
             messagebox.showinfo("Read-Only", "Cannot import to read-only file.")
             return
         
+        if not self._require_saved_file(current_tab):
+            return
+        
         csv_path = filedialog.askopenfilename(
             title="Import from CSV",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         
         if csv_path:
+            from .utils.import_export import import_csv_to_dbf
             if import_csv_to_dbf(csv_path, current_tab.file_path):
                 # Reload data
                 current_tab.load_data()
@@ -509,12 +646,16 @@ class EDVANDBFCommander(ctk.CTk):
             messagebox.showinfo("Read-Only", "Cannot import to read-only file.")
             return
         
+        if not self._require_saved_file(current_tab):
+            return
+        
         xml_path = filedialog.askopenfilename(
             title="Import from XML",
             filetypes=[("XML files", "*.xml"), ("All files", "*.*")]
         )
         
         if xml_path:
+            from .utils.import_export import import_xml_to_dbf
             if import_xml_to_dbf(xml_path, current_tab.file_path):
                 # Reload data
                 current_tab.load_data()
@@ -534,13 +675,10 @@ class EDVANDBFCommander(ctk.CTk):
         )
         
         if csv_path:
-            try:
-                data_to_export = current_tab.filtered_df if current_tab.filtered_df is not None else current_tab.df
-                data_to_export.to_csv(csv_path, index=False)
-                messagebox.showinfo("Export", f"Data exported to {os.path.basename(csv_path)}")
-                logger.info(f"CSV export completed: {csv_path}")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            from .utils.import_export import export_dataframe_to_csv
+            
+            self._export_view(current_tab, "CSV", csv_path,
+                              lambda data: export_dataframe_to_csv(data, csv_path))
     
     def export_to_xml(self):
         """Export data to XML file"""
@@ -556,25 +694,10 @@ class EDVANDBFCommander(ctk.CTk):
         )
         
         if xml_path:
-            try:
-                data_to_export = current_tab.filtered_df if current_tab.filtered_df is not None else current_tab.df
-                
-                root = ET.Element("data")
-                for _, row in data_to_export.iterrows():
-                    record = ET.SubElement(root, "record")
-                    for col, value in row.items():
-                        field = ET.SubElement(record, str(col).lower())
-                        field.text = str(value) if value is not None else ""
-                
-                xml_str = ET.tostring(root, encoding='unicode')
-                dom = minidom.parseString(xml_str)
-                with open(xml_path, 'w', encoding='utf-8') as f:
-                    f.write(dom.toprettyxml())
-                
-                messagebox.showinfo("Export", f"Data exported to {os.path.basename(xml_path)}")
-                logger.info(f"XML export completed: {xml_path}")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            from .utils.import_export import export_dataframe_to_xml
+            
+            self._export_view(current_tab, "XML", xml_path,
+                              lambda data: export_dataframe_to_xml(data, xml_path))
     
     def export_to_excel(self):
         """Export data to Excel file"""
@@ -590,13 +713,10 @@ class EDVANDBFCommander(ctk.CTk):
         )
         
         if excel_path:
-            try:
-                data_to_export = current_tab.filtered_df if current_tab.filtered_df is not None else current_tab.df
-                data_to_export.to_excel(excel_path, index=False)
-                messagebox.showinfo("Export", f"Data exported to {os.path.basename(excel_path)}")
-                logger.info(f"Excel export completed: {excel_path}")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            from .utils.import_export import export_dataframe_to_excel
+            
+            self._export_view(current_tab, "Excel", excel_path,
+                              lambda data: export_dataframe_to_excel(data, excel_path))
     
     def export_to_html(self):
         """Export data to HTML file"""
@@ -612,33 +732,59 @@ class EDVANDBFCommander(ctk.CTk):
         )
         
         if html_path:
-            try:
-                data_to_export = current_tab.filtered_df if current_tab.filtered_df is not None else current_tab.df
-                
-                html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>DBF Data Export</title>
-    <style>
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-    <h1>DBF Data Export</h1>
-    {data_to_export.to_html(index=False, classes='data-table')}
-</body>
-</html>
-"""
-                
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                messagebox.showinfo("Export", f"Data exported to {os.path.basename(html_path)}")
-                logger.info(f"HTML export completed: {html_path}")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            self._export_view(current_tab, "HTML", html_path,
+                              lambda data: self._write_html(data, html_path))
+    
+    def _export_view(self, current_tab, kind: str, path: str, write):
+        """Export the tab's current view with write(data) once its data is in memory"""
+        if not current_tab.require_data(lambda: self._export_view(current_tab, kind, path, write)):
+            return
+        
+        data_to_export = self._export_snapshot(current_tab)
+        if data_to_export is None:
+            return
+        self._export_in_background(kind, path, lambda: write(data_to_export))
+    
+    def _export_snapshot(self, current_tab) -> 'pd.DataFrame':
+        """Copy of the tab's current view to export, or None after telling the user why not"""
+        try:
+            data = current_tab.get_display_df()
+            if data is None:
+                messagebox.showinfo("No Data", "There is no data to export yet.")
+                return None
+            # The export runs on a worker thread; a full copy keeps later edits out of it
+            return data.copy()
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            logger.error(f"Export of {current_tab.file_path} failed: {str(e)}")
+            return None
+    
+    def _write_html(self, data_to_export: 'pd.DataFrame', html_path: str):
+        """Write data as an HTML page (runs on a worker thread)"""
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(HTML_EXPORT_HEADER)
+            # pandas writes the table straight into the file
+            data_to_export.to_html(buf=f, index=False, classes='data-table')
+            f.write(HTML_EXPORT_FOOTER)
+    
+    def _export_in_background(self, kind: str, path: str, write):
+        """Run an export on the I/O pool and report the outcome when it finishes"""
+        from .utils.background import run_in_background
+        
+        file_name = os.path.basename(path)
+        self.update_status(f"Exporting to {file_name}...")
+        
+        def on_done(_):
+            self.update_status(f"Exported: {file_name}")
+            messagebox.showinfo("Export", f"Data exported to {file_name}")
+            logger.info(f"{kind} export completed: {path}")
+        
+        def on_error(e):
+            self.update_status("Export failed")
+            messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+            logger.error(f"{kind} export to {path} failed: {str(e)}")
+        
+        run_in_background(self, write, on_done, on_error)
     
     def convert_ansi_to_oem(self):
         """Convert from Windows ANSI to MS-DOS OEM encoding"""
@@ -651,6 +797,9 @@ class EDVANDBFCommander(ctk.CTk):
             messagebox.showinfo("Read-Only", "Cannot modify read-only file.")
             return
         
+        if not self._require_saved_file(current_tab):
+            return
+        
         if messagebox.askyesno("Confirm Conversion", 
                               "Convert encoding from Windows (ANSI) to MS-DOS (OEM)?\n\n" +
                               "A backup will be created before conversion."):
@@ -669,6 +818,9 @@ class EDVANDBFCommander(ctk.CTk):
             messagebox.showinfo("Read-Only", "Cannot modify read-only file.")
             return
         
+        if not self._require_saved_file(current_tab):
+            return
+        
         if messagebox.askyesno("Confirm Conversion", 
                               "Convert encoding from MS-DOS (OEM) to Windows (ANSI)?\n\n" +
                               "A backup will be created before conversion."):
@@ -687,6 +839,9 @@ class EDVANDBFCommander(ctk.CTk):
             messagebox.showinfo("Read-Only", "Cannot modify read-only file.")
             return
         
+        if not self._require_saved_file(current_tab):
+            return
+        
         if messagebox.askyesno("Confirm Conversion", 
                               "Convert encoding from Windows (ANSI) to UTF-8?\n\n" +
                               "A backup will be created before conversion."):
@@ -705,6 +860,9 @@ class EDVANDBFCommander(ctk.CTk):
             messagebox.showinfo("Read-Only", "Cannot modify read-only file.")
             return
         
+        if not self._require_saved_file(current_tab):
+            return
+        
         if messagebox.askyesno("Confirm Conversion", 
                               "Convert encoding from UTF-8 to Windows (ANSI)?\n\n" +
                               "A backup will be created before conversion."):
@@ -713,46 +871,35 @@ class EDVANDBFCommander(ctk.CTk):
                 messagebox.showinfo("Success", "Encoding converted successfully!")
     
     def show_about(self):
-        """Show about dialog"""
-        about_text = """
-EDVAN DBF Commander v1.1
-
-A modern, feature-rich DBF file management application built with Python and CustomTkinter.
-
-Features:
-• Tabbed interface for multiple files
-• Structure editor with field management
-• SQL query support
-• Data filtering and sorting
-• Import/Export (CSV, XML, Excel, HTML)
-• Find & Replace functionality
-• Encoding conversion support
-• Backup and read-only modes
-
-Built with:
-• Python 3
-• CustomTkinter
-• dbfpy3
-• pandas
-• openpyxl
-
-© 2026 EDVAN DBF Commander
-        """
+        """Show about dialog; the window is built once and reused"""
+        if self._about_window is not None and self._about_window.winfo_exists():
+            self._about_window.deiconify()
+            self._about_window.lift()
+            self._about_window.grab_set()
+            return
         
         about_window = ctk.CTkToplevel(self)
         about_window.title("About EDVAN DBF Commander")
         about_window.geometry("500x400")
         about_window.transient(self)
         about_window.grab_set()
+        about_window.protocol("WM_DELETE_WINDOW", self._hide_about)
         
         text_widget = ctk.CTkTextbox(about_window)
         text_widget.pack(fill="both", expand=True, padx=20, pady=20)
-        text_widget.insert("1.0", about_text)
+        text_widget.insert("1.0", ABOUT_TEXT)
         text_widget.configure(state="disabled")
         
         close_button = ctk.CTkButton(about_window, text="Close", 
-                                    command=about_window.destroy)
+                                    command=self._hide_about)
         close_button.pack(pady=(0, 20))
+        
+        self._about_window = about_window
+    
+    def _hide_about(self):
+        """Hide the about dialog so it can be shown again"""
+        self._about_window.grab_release()
+        self._about_window.withdraw()
 
 
 def main():
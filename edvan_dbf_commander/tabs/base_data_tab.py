@@ -8,7 +8,6 @@ pagination, SQL queries, sorting, and filtering.
 """
 
 import os
-import shutil
 import sqlite3
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -16,11 +15,19 @@ from tkinter import messagebox
 import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
+import numpy as np
 import pandas as pd
 import logging
 
+from ..utils.files import copy_file
+from ..utils.optional import has_module, load_duckdb, load_pyarrow
+
 logger = logging.getLogger(__name__)
 
+# Check for DuckDB support (faster SQL queries without copying the data);
+# duckdb itself is imported on the first query
+DUCKDB_SUPPORT = has_module('duckdb')
+
 
 class BaseDataTab(ctk.CTkFrame, ABC):
     """Abstract base class for data tabs with shared functionality"""
@@ -35,13 +42,41 @@ class BaseDataTab(ctk.CTkFrame, ABC):
         self.total_records = 0
         self.df = None
         self.filtered_df = None
+        self._query_cache = {}  # Query text -> result for the current self.df
+        self._query_cache_df = None
+        self._text_cache = {}  # (column, form) -> cell text of _text_cache_df, for searches
+        self._text_cache_df = None
         self.modified = False
         self.sort_column = None
         self.sort_ascending = True
+        self._duck = None  # DuckDB connection reused across queries
+        self._tree_columns = None  # Columns currently configured on the tree
+        self._sort_base = None  # Frame the sort orders and row index refer to
+        self._sort_orders = {}  # Column -> (ascending row order, missing rows)
+        self._row_index = None  # Display order as positions into _sort_base
+        self._display_stale = False  # Rows changed while the tab was hidden
+        self._repaint_after_id = None  # Pending coalesced display refresh
         
         self.setup_ui()
+        # Rows of a background tab are filled in when it is first shown
+        self.bind('<Map>', self._on_map, add='+')
         self.load_data()
     
+    @property
+    def modified(self) -> bool:
+        """Whether the data has unsaved changes"""
+        return self._modified
+    
+    @modified.setter
+    def modified(self, value: bool):
+        self._modified = value
+        # Any edit invalidates cached query results and sort orders; the
+        # current display order is kept
+        if value:
+            self._query_cache.clear()
+            self._text_cache.clear()
+            self._sort_orders = {}
+    
     def setup_ui(self):
         """Setup the data tab UI"""
         # Top toolbar
@@ -129,37 +164,172 @@ class BaseDataTab(ctk.CTkFrame, ABC):
     
     def update_data_display(self):
         """Update the data display for current page"""
-        # Clear existing data
-        for item in self.data_tree.get_children():
-            self.data_tree.delete(item)
+        # Skip Treeview work while the tab is hidden; _on_map catches up
+        if not self.winfo_ismapped():
+            self._display_stale = True
+            return
+        self._display_stale = False
         
-        # Determine which data to display
-        display_df = self.filtered_df if self.filtered_df is not None else self.df
+        # Clear existing data in a single Tk call
+        self.data_tree.delete(*self.data_tree.get_children())
         
-        if display_df is None or len(display_df) == 0:
+        total = self.get_display_count()
+        if total == 0:
             return
         
-        # Configure columns
-        self.data_tree['columns'] = list(display_df.columns)
-        for col in display_df.columns:
-            self.data_tree.heading(col, text=col)
-            self.data_tree.column(col, width=100)
-        
         # Calculate page range
         start_idx = self.current_page * self.rows_per_page
-        end_idx = min(start_idx + self.rows_per_page, len(display_df))
+        end_idx = min(start_idx + self.rows_per_page, total)
+        page = self.get_display_page(start_idx, end_idx)
+        
+        # Configure columns only when they change, not on every page flip
+        columns = list(page.columns)
+        if columns != self._tree_columns:
+            self.data_tree['columns'] = columns
+            for col in columns:
+                self.data_tree.heading(col, text=col)
+                self.data_tree.column(col, width=100)
+            self._tree_columns = columns
         
-        # Insert data rows
-        for idx in range(start_idx, end_idx):
-            values = [str(display_df.iloc[idx][col]) for col in display_df.columns]
-            self.data_tree.insert('', 'end', values=values)
+        # Stringify the visible page in one vectorized pass; missing values show blank
+        page = page.astype(str).where(page.notna(), "")
+        
+        # Insert data rows through the raw Tcl command, skipping the per-call
+        # option formatting done by Treeview.insert
+        tk_call = self.data_tree.tk.call
+        tree = self.data_tree._w
+        for values in page.itertuples(index=False, name=None):
+            tk_call(tree, 'insert', '', 'end', '-values', values)
         
         self.update_pagination_info()
     
+    def schedule_repaint(self):
+        """Refresh the data display once pending events are handled, coalescing repeated calls"""
+        if self._repaint_after_id is None:
+            self._repaint_after_id = self.after_idle(self._do_repaint)
+    
+    def _do_repaint(self):
+        """Run the scheduled display refresh"""
+        self._repaint_after_id = None
+        self.update_data_display()
+    
+    def _on_map(self, event):
+        """Fill in rows that changed while the tab was hidden"""
+        if self._display_stale:
+            self.update_data_display()
+    
+    def get_display_count(self) -> int:
+        """Number of rows in the current (filtered or full) view"""
+        display_df = self.filtered_df if self.filtered_df is not None else self.df
+        return len(display_df) if display_df is not None else 0
+    
+    def get_display_page(self, start: int, end: int) -> pd.DataFrame:
+        """Rows start:end of the current view - may be overridden for lazy sources"""
+        display_df = self.filtered_df if self.filtered_df is not None else self.df
+        order = self._display_order(display_df)
+        if order is None:
+            return display_df.iloc[start:end]
+        return display_df.take(order[start:end])
+    
+    def get_display_df(self) -> pd.DataFrame:
+        """The current view as a DataFrame in display order"""
+        display_df = self.filtered_df if self.filtered_df is not None else self.df
+        order = self._display_order(display_df)
+        if order is None:
+            return display_df
+        # Sorted views are only materialized when a whole frame is needed
+        return display_df.take(order).reset_index(drop=True)
+    
+    @property
+    def file_pending(self) -> bool:
+        """True while the tab's data has not been written to file_path yet"""
+        return False
+    
+    def require_data(self, action) -> bool:
+        """
+        Check that the full data is in memory before working on all of it.
+        
+        Tabs that read their data in the background override this to start
+        the read and run action once it has finished.
+        
+        Args:
+            action: Callable re-running the caller when the data arrives
+        
+        Returns:
+            bool: True if self.df can be used now
+        """
+        return True
+    
+    def get_row_position(self, display_position: int) -> int:
+        """Position in the shown frame of the row at display_position"""
+        display_df = self.filtered_df if self.filtered_df is not None else self.df
+        order = self._display_order(display_df)
+        if order is None:
+            return display_position
+        return int(order[display_position])
+    
+    def get_row_positions(self, display_positions: np.ndarray) -> np.ndarray:
+        """Positions in the shown frame of the rows at an array of display positions"""
+        display_df = self.filtered_df if self.filtered_df is not None else self.df
+        order = self._display_order(display_df)
+        if order is None:
+            return display_positions
+        return order[display_positions]
+    
+    def get_column_text(self, col_name, lower: bool = False) -> np.ndarray:
+        """Cell text of a column of the current view in display order, as shown in the grid"""
+        display_df = self._text_cache_frame()
+        kind = 'lower' if lower else 'text'
+        text = self._text_cache.get((col_name, kind))
+        if text is None:
+            text = self._column_text(display_df, col_name)
+            if lower:
+                text = pd.Series(text, dtype=object).str.lower().to_numpy(dtype=object)
+                self._text_cache[(col_name, kind)] = text
+        
+        order = self._display_order(display_df)
+        return text if order is None else text[order]
+    
+    def get_column_strings(self, col_name):
+        """Cell text of a column of the current view in display order, as a pyarrow string array"""
+        display_df = self._text_cache_frame()
+        strings = self._text_cache.get((col_name, 'arrow'))
+        if strings is None:
+            pa = load_pyarrow()
+            strings = pa.array(self._column_text(display_df, col_name), type=pa.string())
+            self._text_cache[(col_name, 'arrow')] = strings
+        
+        order = self._display_order(display_df)
+        return strings if order is None else strings.take(order)
+    
+    def _text_cache_frame(self) -> pd.DataFrame:
+        """The shown frame, resetting the text cache if it was built for another frame"""
+        display_df = self.filtered_df if self.filtered_df is not None else self.df
+        # Cached per frame so repeated searches do not stringify the column again
+        if self._text_cache_df is not display_df:
+            self._text_cache.clear()
+            self._text_cache_df = display_df
+        return display_df
+    
+    def _column_text(self, display_df: pd.DataFrame, col_name) -> np.ndarray:
+        """Cached cell text of a column in the frame's own order"""
+        text = self._text_cache.get((col_name, 'text'))
+        if text is None:
+            values = display_df[col_name]
+            text = values.astype(str).where(values.notna(), "").to_numpy(dtype=object)
+            self._text_cache[(col_name, 'text')] = text
+        return text
+    
+    def _display_order(self, display_df: pd.DataFrame):
+        """Row positions in display order, or None for the frame's own order"""
+        # The row index only applies to the frame it was computed for
+        if self._row_index is not None and display_df is self._sort_base:
+            return self._row_index
+        return None
+    
     def update_pagination_info(self):
         """Update pagination information"""
-        display_df = self.filtered_df if self.filtered_df is not None else self.df
-        total = len(display_df) if display_df is not None else 0
+        total = self.get_display_count()
         total_pages = max(1, (total + self.rows_per_page - 1) // self.rows_per_page)
         self.page_label.configure(text=f"Page {self.current_page + 1}/{total_pages}")
     
@@ -176,8 +346,7 @@ class BaseDataTab(ctk.CTkFrame, ABC):
     
     def next_page(self):
         """Go to next page"""
-        display_df = self.filtered_df if self.filtered_df is not None else self.df
-        total = len(display_df) if display_df is not None else 0
+        total = self.get_display_count()
         total_pages = max(1, (total + self.rows_per_page - 1) // self.rows_per_page)
         if self.current_page < total_pages - 1:
             self.current_page += 1
@@ -185,8 +354,7 @@ class BaseDataTab(ctk.CTkFrame, ABC):
     
     def last_page(self):
         """Go to last page"""
-        display_df = self.filtered_df if self.filtered_df is not None else self.df
-        total = len(display_df) if display_df is not None else 0
+        total = self.get_display_count()
         total_pages = max(1, (total + self.rows_per_page - 1) // self.rows_per_page)
         self.current_page = total_pages - 1
         self.update_data_display()
@@ -198,21 +366,36 @@ class BaseDataTab(ctk.CTkFrame, ABC):
             messagebox.showinfo("SQL Query", "Please enter a SQL query")
             return
         
+        if not self.require_data(self.execute_sql):
+            return
+        
         if self.df is None:
             messagebox.showerror("Error", "No data loaded")
             return
         
+        # Cached results are only valid for the DataFrame they were run on
+        if self._query_cache_df is not self.df:
+            self._query_cache.clear()
+            self._query_cache_df = self.df
+        
         try:
-            # Create in-memory SQLite database
-            conn = sqlite3.connect(':memory:')
-            self.df.to_sql('data', conn, index=False, if_exists='replace')
-            
-            # Execute query
-            result = pd.read_sql_query(query, conn)
-            conn.close()
+            result = self._query_cache.get(query)
+            if result is None:
+                if DUCKDB_SUPPORT:
+                    result = self._query_duckdb(query)
+                else:
+                    # Create in-memory SQLite database
+                    conn = sqlite3.connect(':memory:')
+                    self.df.to_sql('data', conn, index=False, if_exists='replace')
+                    
+                    # Execute query
+                    result = pd.read_sql_query(query, conn)
+                    conn.close()
+                self._query_cache[query] = result
             
-            # Store filtered result
+            # Store filtered result, shown in its own order
             self.filtered_df = result
+            self._row_index = None
             self.current_page = 0
             self.update_data_display()
             
@@ -222,9 +405,25 @@ class BaseDataTab(ctk.CTkFrame, ABC):
             messagebox.showerror("SQL Error", f"Query failed: {str(e)}")
             logger.error(f"SQL query failed: {str(e)}")
     
+    def _query_duckdb(self, query: str) -> pd.DataFrame:
+        """Run a query with DuckDB over the current DataFrame"""
+        if self._duck is None:
+            self._duck = load_duckdb().connect()
+        
+        # Registering is zero-copy, so the view is refreshed on every query
+        # to pick up in-place edits and reloads
+        self._duck.register('data', self.get_sql_source())
+        return self._duck.execute(query).df()
+    
+    def get_sql_source(self):
+        """Object DuckDB queries as 'data' - may be overridden to expose Arrow data"""
+        return self.df
+    
     def clear_filter(self):
         """Clear current filter and show all data"""
         self.filtered_df = None
+        self._row_index = None
+        self.sort_column = None
         self.sql_entry.delete(0, 'end')
         self.current_page = 0
         self.update_data_display()
@@ -236,6 +435,9 @@ class BaseDataTab(ctk.CTkFrame, ABC):
             column = self.data_tree.identify_column(event.x)
             col_index = int(column[1:]) - 1  # Column index (0-based)
             
+            if not self.require_data(lambda: self.on_header_click(event)):
+                return
+            
             display_df = self.filtered_df if self.filtered_df is not None else self.df
             if display_df is not None and col_index < len(display_df.columns):
                 col_name = display_df.columns[col_index]
@@ -247,18 +449,31 @@ class BaseDataTab(ctk.CTkFrame, ABC):
                     self.sort_column = col_name
                     self.sort_ascending = True
                 
-                # Sort the data
-                if self.filtered_df is not None:
-                    self.filtered_df = self.filtered_df.sort_values(
-                        by=col_name, ascending=self.sort_ascending
-                    ).reset_index(drop=True)
-                else:
-                    self.df = self.df.sort_values(
-                        by=col_name, ascending=self.sort_ascending
-                    ).reset_index(drop=True)
+                # Sort the view; the data itself stays in place
+                self._sort_rows(display_df, col_name, self.sort_ascending)
                 
                 self.update_data_display()
     
+    def _sort_rows(self, frame: pd.DataFrame, col_name, ascending: bool):
+        """Set the display order of frame's rows by col_name, reusing cached orders"""
+        # Orders are row positions into frame, valid until the frame changes
+        if frame is not self._sort_base:
+            self._sort_base = frame
+            self._sort_orders = {}
+        
+        order = self._sort_orders.get(col_name)
+        if order is None:
+            values = frame[col_name]
+            missing = values.isna().to_numpy()
+            present = np.flatnonzero(~missing)
+            present = present[np.argsort(values.to_numpy()[present], kind='stable')]
+            order = (present, np.flatnonzero(missing))
+            self._sort_orders[col_name] = order
+        
+        # Descending is the reversed ascending order; missing values stay last
+        present, missing = order
+        self._row_index = np.concatenate([present if ascending else present[::-1], missing])
+    
     def on_double_click(self, event):
         """Handle double-click for editing - to be overridden by subclasses"""
         pass
@@ -272,7 +487,7 @@ class BaseDataTab(ctk.CTkFrame, ABC):
             backup_name = f"{os.path.splitext(file_name)[0]}_backup_{timestamp}{os.path.splitext(file_name)[1]}"
             backup_path = os.path.join(backup_dir, backup_name)
             
-            shutil.copy2(self.file_path, backup_path)
+            copy_file(self.file_path, backup_path)
             messagebox.showinfo("Backup", f"Backup created: {backup_name}")
             logger.info(f"Backup created: {backup_path}")
             
@@ -282,12 +497,22 @@ class BaseDataTab(ctk.CTkFrame, ABC):
     
     def cleanup(self):
         """Cleanup resources when tab is closed"""
+        if self._repaint_after_id is not None:
+            self.after_cancel(self._repaint_after_id)
+            self._repaint_after_id = None
+        
         # Clear dataframes to free memory
-        if self.df is not None:
-            del self.df
-            self.df = None
-        if self.filtered_df is not None:
-            del self.filtered_df
-            self.filtered_df = None
+        self.df = None
+        self.filtered_df = None
+        self._query_cache.clear()
+        self._query_cache_df = None
+        self._text_cache.clear()
+        self._text_cache_df = None
+        self._sort_base = None
+        self._sort_orders = {}
+        self._row_index = None
+        if self._duck is not None:
+            self._duck.close()
+            self._duck = None
         
         logger.info(f"Resources cleaned up for: {self.file_path}")
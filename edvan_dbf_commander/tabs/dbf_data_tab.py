@@ -8,13 +8,17 @@ Extends BaseDataTab with DBF-specific functionality.
 """
 
 import os
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import customtkinter as ctk
 import pandas as pd
-from dbfpy3 import dbf
 import logging
 
 from .base_data_tab import BaseDataTab
+from ..utils.background import run_in_background
+from ..utils.dtypes import use_arrow_strings
+from ..utils.dbf_reader import read_dbf
+from ..utils.dbf_writer import WRITABLE_FIELD_TYPES, read_dbf_fields, write_dbf
+from ..utils.import_export import export_dataframe_to_dbf
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +26,18 @@ logger = logging.getLogger(__name__)
 class DBFDataTab(BaseDataTab):
     """Data tab for DBF files"""
     
-    def __init__(self, parent, file_path: str, read_only: bool = False):
+    def __init__(self, parent, file_path: str, read_only: bool = False,
+                 df: pd.DataFrame = None):
+        # Data handed over in memory is shown as-is instead of reading the file
+        self._source_df = df
+        self._file_pending = df is not None  # file_path not written yet
         super().__init__(parent, file_path, read_only)
     
+    @property
+    def file_pending(self) -> bool:
+        """True while data opened from memory has not been saved to file_path"""
+        return self._file_pending
+    
     def setup_toolbar_buttons(self, toolbar):
         """Setup DBF-specific toolbar buttons"""
         if not self.read_only:
@@ -36,31 +49,35 @@ class DBFDataTab(BaseDataTab):
                          command=self.save_changes).pack(side="right", padx=5)
     
     def load_data(self):
-        """Load DBF data"""
-        try:
-            with dbf.Dbf(self.file_path) as db:
-                records = []
-                field_names = [field.name for field in db.header.fields]
-                
-                for record in db:
-                    row_data = []
-                    for field in field_names:
-                        value = record[field]
-                        row_data.append(value)
-                    records.append(row_data)
-                
-                # Create DataFrame
-                self.df = pd.DataFrame(records, columns=field_names)
-                self.total_records = len(self.df)
-                
-            # Update display
-            self.update_data_display()
-            
-            logger.info(f"Loaded DBF file: {self.file_path} ({self.total_records} records)")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load DBF file: {str(e)}")
-            logger.error(f"Failed to load DBF file {self.file_path}: {str(e)}")
+        """Load DBF data on the I/O pool without blocking the UI"""
+        if self._source_df is not None:
+            df, self._source_df = self._source_df, None
+            self._on_data_loaded(df)
+            # Nothing is on disk yet, so the data counts as unsaved
+            self.modified = True
+            return
+        
+        run_in_background(self, self._read_dbf, self._on_data_loaded, self._on_load_error)
+    
+    def _read_dbf(self) -> pd.DataFrame:
+        """Read the DBF file into a DataFrame (runs on a worker thread)"""
+        # Text columns move to Arrow strings
+        return use_arrow_strings(read_dbf(self.file_path))
+    
+    def _on_data_loaded(self, df: pd.DataFrame):
+        """Show loaded data (runs on the UI thread)"""
+        self.df = df
+        self.total_records = len(self.df)
+        
+        # Update display
+        self.update_data_display()
+        
+        logger.info(f"Loaded DBF file: {self.file_path} ({self.total_records} records)")
+    
+    def _on_load_error(self, e: Exception):
+        """Report a failed load (runs on the UI thread)"""
+        messagebox.showerror("Error", f"Failed to load DBF file: {str(e)}")
+        logger.error(f"Failed to load DBF file {self.file_path}: {str(e)}")
     
     def on_double_click(self, event):
         """Handle double-click for editing"""
@@ -96,7 +113,8 @@ class DBFDataTab(BaseDataTab):
             
             if new_value is not None:
                 # Update the dataframe
-                row_index = self.data_tree.index(item) + (self.current_page * self.rows_per_page)
+                row_index = self.get_row_position(
+                    self.data_tree.index(item) + (self.current_page * self.rows_per_page))
                 self.df.at[row_index, col_name] = new_value
                 self.modified = True
                 
@@ -135,7 +153,8 @@ class DBFDataTab(BaseDataTab):
         # Get indices to delete
         indices_to_delete = []
         for item in selected:
-            row_index = self.data_tree.index(item) + (self.current_page * self.rows_per_page)
+            row_index = self.get_row_position(
+                self.data_tree.index(item) + (self.current_page * self.rows_per_page))
             indices_to_delete.append(row_index)
         
         # Delete rows
@@ -157,43 +176,39 @@ class DBFDataTab(BaseDataTab):
             return
         
         try:
-            # Create backup first
-            self.backup_file()
-            
-            # Re-create DBF file with updated data
-            import dbf as dbf_lib
-            
-            # Get field specs from original file
-            with dbf.Dbf(self.file_path) as db:
-                field_specs = []
-                for field in db.header.fields:
-                    if field.type == 'N':
-                        field_specs.append(f"{field.name} N({field.length},{field.decimal_count})")
-                    elif field.type == 'C':
-                        field_specs.append(f"{field.name} C({field.length})")
-                    elif field.type == 'D':
-                        field_specs.append(f"{field.name} D")
-                    elif field.type == 'L':
-                        field_specs.append(f"{field.name} L")
-                    elif field.type == 'M':
-                        field_specs.append(f"{field.name} M")
-            
-            # Create new DBF file
-            table = dbf_lib.Table(self.file_path, '; '.join(field_specs))
-            table.open(mode=dbf_lib.READ_WRITE)
-            
-            # Add records
-            for _, row in self.df.iterrows():
-                record = table.new()
-                for i, (col, value) in enumerate(row.items()):
-                    field_name = list(table.field_names)[i]
-                    if pd.isna(value) or value == '':
-                        setattr(record, field_name, '')
-                    else:
-                        setattr(record, field_name, value)
-                record.write_record()
-            
-            table.close()
+            if not self._file_pending:
+                # Refuse before the backup if a field cannot be written back
+                fields, language_driver = read_dbf_fields(self.file_path)
+                unsupported = sorted({field.type for field in fields} - set(WRITABLE_FIELD_TYPES))
+                if unsupported:
+                    messagebox.showerror("Save Error",
+                                         "This table has field types that cannot be saved: "
+                                         f"{', '.join(unsupported)}.\nThe file was not changed.")
+                    return
+                
+                # Create backup first
+                self.backup_file()
+                
+                # Re-create DBF file with updated data, keeping the original
+                # field definitions and code page, in a single write
+                write_dbf(self.df, self.file_path, fields, language_driver)
+            else:
+                # Data opened from memory: ask where to write it, so no
+                # existing file is replaced without the dialog's confirmation
+                save_path = filedialog.asksaveasfilename(
+                    title="Save DBF File",
+                    defaultextension=".dbf",
+                    filetypes=[("DBF files", "*.dbf"), ("All files", "*.*")],
+                    initialdir=os.path.dirname(self.file_path),
+                    initialfile=os.path.basename(self.file_path)
+                )
+                if not save_path:
+                    return
+                
+                # Derive the fields from the data
+                export_dataframe_to_dbf(self.df, save_path)
+                self.file_path = save_path
+                self._file_pending = False
             
             self.modified = False
             messagebox.showinfo("Save", "Changes saved successfully")
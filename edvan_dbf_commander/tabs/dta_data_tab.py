@@ -8,21 +8,24 @@ Extends BaseDataTab with DTA-specific functionality.
 """
 
 import os
+from collections import OrderedDict
 from tkinter import messagebox
 import customtkinter as ctk
 import pandas as pd
 import logging
 
-from .base_data_tab import BaseDataTab
+from .base_data_tab import BaseDataTab, DUCKDB_SUPPORT
+from ..utils.background import run_in_background
+from ..utils.dtypes import PYARROW_SUPPORT, use_arrow_strings
+from ..utils.optional import has_module, load_pyarrow, load_pyreadstat
 
 logger = logging.getLogger(__name__)
 
-# Check for Stata support
-STATA_SUPPORT = True
-try:
-    import pyreadstat
-except ImportError:
-    STATA_SUPPORT = False
+# Check for Stata support; pyreadstat itself is imported on first use
+STATA_SUPPORT = has_module('pyreadstat')
+
+# Number of recently viewed pages kept in memory before the full file is loaded
+PAGE_CACHE_SIZE = 8
 
 
 class DTADataTab(BaseDataTab):
@@ -30,14 +33,68 @@ class DTADataTab(BaseDataTab):
     
     def __init__(self, parent, file_path: str, read_only: bool = True):
         self.meta = None
+        self._arrow = None  # Arrow table backing the full read, when available
+        self._full_load = None  # Future of the background full read while it runs
+        self._pending_action = None  # Request waiting for the full read
+        self._page_cache = OrderedDict()  # Page index -> DataFrame
         # DTA files are always read-only in this application
         super().__init__(parent, file_path, read_only=True)
     
+    def require_data(self, action) -> bool:
+        """Start reading the full file in the background; action runs once it is in memory"""
+        if self.df is not None or self.meta is None:
+            return True
+        
+        # Only the latest request is kept, so repeated clicks run it once
+        self._pending_action = action
+        if self._full_load is None:
+            self.status_label.configure(text=f"{self._status_text()} - loading all records...")
+            self._full_load = run_in_background(self, self._read_full,
+                                                self._on_full_loaded,
+                                                self._on_full_load_error)
+        return False
+    
+    def _read_full(self):
+        """Read every row of the file (runs on the I/O pool)"""
+        df, _ = load_pyreadstat().read_dta(self.file_path)
+        arrow = None
+        if DUCKDB_SUPPORT and PYARROW_SUPPORT:
+            # DuckDB scans an Arrow table in place, so the full read is
+            # kept as Arrow and the DataFrame views the same buffers
+            arrow = load_pyarrow().Table.from_pandas(df, preserve_index=False)
+            df = arrow.to_pandas(types_mapper=pd.ArrowDtype)
+        return use_arrow_strings(df), arrow
+    
+    def _on_full_loaded(self, result):
+        """Switch from page reads to the full DataFrame (runs on the UI thread)"""
+        self._full_load = None
+        if self.meta is None:
+            # Tab was closed while the file was being read
+            return
+        self.df, self._arrow = result
+        self._page_cache.clear()
+        self.status_label.configure(text=self._status_text())
+        logger.info(f"Read all {len(self.df)} records of {self.file_path}")
+        
+        action, self._pending_action = self._pending_action, None
+        if action is not None:
+            action()
+    
+    def _on_full_load_error(self, e: Exception):
+        """Report a failed full read; the next request tries again"""
+        self._full_load = None
+        self._pending_action = None
+        self.status_label.configure(text=self._status_text())
+        self._on_load_error(e)
+    
+    def _status_text(self) -> str:
+        """Status line naming the file"""
+        return f"{os.path.basename(self.file_path)} (Stata DTA - Read-Only)"
+    
     def setup_toolbar_buttons(self, toolbar):
         """Setup DTA-specific toolbar buttons"""
         # Update status to show it's a Stata file
-        file_name = os.path.basename(self.file_path)
-        self.status_label.configure(text=f"{file_name} (Stata DTA - Read-Only)")
+        self.status_label.configure(text=self._status_text())
         
         # Add convert button
         ctk.CTkButton(toolbar, text="Convert to DBF", width=120,
@@ -51,19 +108,81 @@ class DTADataTab(BaseDataTab):
                                "Please install it with: pip install pyreadstat")
             return
         
+        # Read only the metadata; rows are fetched page by page for display
+        run_in_background(
+            self,
+            lambda: load_pyreadstat().read_dta(self.file_path, metadataonly=True)[1],
+            self._on_meta_loaded,
+            self._on_load_error
+        )
+    
+    def _on_meta_loaded(self, meta):
+        """Show the first page once metadata is read (runs on the UI thread)"""
+        self.meta = meta
+        self.total_records = self.meta.number_rows
+        
+        # Update display (reads the first page from disk)
         try:
-            # Read the Stata file with metadata
-            self.df, self.meta = pyreadstat.read_dta(self.file_path)
-            self.total_records = len(self.df)
-            
-            # Update display
             self.update_data_display()
-            
-            logger.info(f"Loaded DTA file: {self.file_path} ({self.total_records} records)")
-            
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load DTA file: {str(e)}")
-            logger.error(f"Failed to load DTA file {self.file_path}: {str(e)}")
+            self._on_load_error(e)
+            return
+        
+        logger.info(f"Loaded DTA file: {self.file_path} ({self.total_records} records)")
+    
+    def _on_load_error(self, e: Exception):
+        """Report a failed load (runs on the UI thread)"""
+        messagebox.showerror("Error", f"Failed to load DTA file: {str(e)}")
+        logger.error(f"Failed to load DTA file {self.file_path}: {str(e)}")
+    
+    def get_sql_source(self):
+        """Query the Arrow table directly when the full read produced one"""
+        if self._arrow is not None:
+            return self._arrow
+        return super().get_sql_source()
+    
+    def _is_paged(self) -> bool:
+        """True while the view is served from on-demand page reads"""
+        return self.filtered_df is None and self.df is None
+    
+    def get_display_count(self) -> int:
+        """Number of rows in the current view"""
+        if self._is_paged():
+            return self.total_records if self.meta is not None else 0
+        return super().get_display_count()
+    
+    def get_display_page(self, start: int, end: int) -> pd.DataFrame:
+        """Rows start:end of the current view, read from disk when paged"""
+        if self._is_paged():
+            return self._load_page(start // self.rows_per_page)
+        return super().get_display_page(start, end)
+    
+    def _load_page(self, page_idx: int) -> pd.DataFrame:
+        """Read one page of rows, keeping the most recent pages cached"""
+        page = self._page_cache.get(page_idx)
+        if page is not None:
+            self._page_cache.move_to_end(page_idx)
+            return page
+        
+        page, _ = load_pyreadstat().read_dta(self.file_path,
+                                             row_offset=page_idx * self.rows_per_page,
+                                             row_limit=self.rows_per_page)
+        self._page_cache[page_idx] = page
+        if len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return page
+    
+    def cleanup(self):
+        """Cleanup resources when tab is closed"""
+        # A full read still running is dropped when it finishes
+        self.meta = None
+        self._pending_action = None
+        if self._full_load is not None:
+            self._full_load.cancel()
+            self._full_load = None
+        self._arrow = None
+        self._page_cache.clear()
+        super().cleanup()
     
     def convert_to_dbf(self):
         """Open conversion dialog"""
@@ -1,24 +1,47 @@
 # EDVAN DBF Commander - Utils Package
 """Utility functions and helpers for EDVAN DBF Commander."""
 
-from .encoding import (
-    convert_ansi_to_oem,
-    convert_oem_to_ansi,
-    convert_ansi_to_utf8,
-    convert_utf8_to_ansi
-)
-from .import_export import (
-    import_csv_to_dbf,
-    import_xml_to_dbf,
-    cleanup_temp_files
-)
+from importlib import import_module
 
-__all__ = [
-    'convert_ansi_to_oem',
-    'convert_oem_to_ansi',
-    'convert_ansi_to_utf8',
-    'convert_utf8_to_ansi',
-    'import_csv_to_dbf',
-    'import_xml_to_dbf',
-    'cleanup_temp_files'
-]
+# Public name -> submodule. Submodules are imported on first attribute
+# access, so importing one lightweight helper does not load pandas.
+_EXPORTS = {
+    'convert_ansi_to_oem': '.encoding',
+    'convert_oem_to_ansi': '.encoding',
+    'convert_ansi_to_utf8': '.encoding',
+    'convert_utf8_to_ansi': '.encoding',
+    'import_csv_to_dbf': '.import_export',
+    'import_xml_to_dbf': '.import_export',
+    'export_dataframe_to_dbf': '.import_export',
+    'export_dataframe_to_csv': '.import_export',
+    'export_dataframe_to_xml': '.import_export',
+    'export_dataframe_to_excel': '.import_export',
+    'cleanup_temp_files': '.import_export',
+    'DBFField': '.dbf_writer',
+    'write_dbf': '.dbf_writer',
+    'append_dbf': '.dbf_writer',
+    'read_dbf_fields': '.dbf_writer',
+    'read_dbf': '.dbf_reader',
+    'iter_dbf_chunks': '.dbf_reader',
+    'use_arrow_strings': '.dtypes',
+    'copy_file': '.files',
+    'get_font': '.fonts',
+    'title_font': '.fonts',
+    'heading_font': '.fonts',
+    'io_pool': '.background',
+    'run_in_background': '.background'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background Work Utilities
+
+Shared worker pool for file reads and writes that would otherwise block
+the Tk event loop.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for blocking file I/O
+io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="edvan-io")
+
+
+def run_in_background(widget, func, on_success, on_error=None):
+    """
+    Run func on the I/O pool and deliver its outcome on the Tk thread.
+
+    Args:
+        widget: Tk widget used to schedule the callback on the UI thread
+        func: Callable taking no arguments, run on a worker thread
+        on_success: Called with func's return value on the UI thread
+        on_error: Called with the raised exception on the UI thread
+
+    Returns:
+        The submitted Future
+    """
+    def finish(future):
+        error = future.exception()
+        if error is None:
+            on_success(future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            logger.error(f"Background task failed: {str(error)}")
+
+    def deliver(future):
+        try:
+            widget.after(0, finish, future)
+        except (tk.TclError, RuntimeError):
+            # Widget was destroyed before the work finished
+            pass
+
+    future = io_pool.submit(func)
+    future.add_done_callback(deliver)
+    return future
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Column-wise DBF Reader
+
+Reads a whole DBF table into a DataFrame. Tables made only of fixed-width
+character, numeric, date and logical fields are decoded a column at a time
+from the raw record bytes; other tables are read record by record through
+dbfpy3. Both paths give the same values dbfpy3 does.
+"""
+
+from typing import Iterator
+import numpy as np
+import pandas as pd
+from dbfpy3 import dbf
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Field types decoded column-wise; anything else (memo, integer, currency,
+# datetime, ...) goes through dbfpy3's record decoder
+COLUMN_TYPES = {b'C', b'N', b'F', b'D', b'L'}
+
+# Logical field values dbfpy3 reads as True, and as unknown (-1)
+LOGICAL_TRUE = [b'Y', b'y', b'T', b't']
+LOGICAL_UNKNOWN = b'?'
+
+
+def read_dbf(dbf_path: str) -> pd.DataFrame:
+    """
+    Read every record of a DBF file into a DataFrame.
+
+    Args:
+        dbf_path: Path to the DBF file
+
+    Returns:
+        pd.DataFrame: One column per field, named as dbfpy3 names them
+    """
+    with dbf.Dbf(dbf_path, read_only=True) as db:
+        if _columns_supported(db.header):
+            columns = _read_columns(db, 0, db.header.record_count)
+        else:
+            columns = _read_records(db, 0, db.header.record_count)
+
+    return _to_frame(columns)
+
+
+def iter_dbf_chunks(dbf_path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Read a DBF file as a sequence of DataFrames of at most chunk_rows rows.
+
+    Only one chunk is held in memory at a time, so a table can be
+    streamed to another format without loading it whole.
+
+    Args:
+        dbf_path: Path to the DBF file
+        chunk_rows: Maximum number of records per chunk
+
+    Yields:
+        pd.DataFrame: Consecutive records, columns as in read_dbf
+    """
+    with dbf.Dbf(dbf_path, read_only=True) as db:
+        read_chunk = _read_columns if _columns_supported(db.header) else _read_records
+        for start in range(0, db.header.record_count, chunk_rows):
+            count = min(chunk_rows, db.header.record_count - start)
+            columns = read_chunk(db, start, count)
+            yield _to_frame(columns)
+            if len(next(iter(columns.values()), ())) < count:
+                break  # File is shorter than the header claims
+
+
+def _columns_supported(header) -> bool:
+    """Whether every field of the table can be decoded column-wise"""
+    return all(field.type_code in COLUMN_TYPES for field in header.fields)
+
+
+def _to_frame(columns: dict) -> pd.DataFrame:
+    """Build the DataFrame for decoded columns"""
+    # infer_objects gives logical fields a bool dtype when none are unknown
+    return pd.DataFrame(columns).infer_objects()
+
+
+def _read_columns(db, start: int, record_count: int) -> dict:
+    """Decode record_count records from start, a field at a time from their raw bytes"""
+    header = db.header
+    fields = header.fields
+    encoding = header.code_page.encoding
+
+    db.stream.seek(header.header_length + start * header.record_length)
+    data = db.stream.read(record_count * header.record_length)
+    record_count = len(data) // header.record_length
+
+    # View the records as a structured array with one byte-string per field
+    layout = np.dtype({
+        'names': [f'f{i}' for i in range(len(fields))],
+        'formats': [f'S{field.length}' for field in fields],
+        'offsets': [field.start for field in fields],
+        'itemsize': header.record_length
+    })
+    records = np.frombuffer(data, dtype=layout, count=record_count)
+
+    return {
+        field.name: _decode_column(records[f'f{i}'], field.type_code, encoding)
+        for i, field in enumerate(fields)
+    }
+
+
+def _decode_column(raw: np.ndarray, type_code: bytes, encoding: str):
+    """Decode one fixed-width byte column the way dbfpy3 decodes a field"""
+    if type_code == b'C':
+        return np.char.rstrip(np.char.decode(raw, encoding), ' ').astype(object)
+
+    if type_code in (b'N', b'F'):
+        # Blank or unparsable numbers read as 0.0
+        text = pd.Series(np.char.decode(np.char.strip(raw, b' \x00'), encoding))
+        return pd.to_numeric(text, errors='coerce').fillna(0.0).to_numpy(dtype=float)
+
+    if type_code == b'D':
+        # Blank dates read as None
+        text = pd.Series(np.char.decode(np.char.strip(raw), encoding))
+        dates = pd.to_datetime(text, format='%Y%m%d', errors='coerce')
+        values = dates.dt.date.to_numpy(dtype=object, copy=True)
+        values[dates.isna().to_numpy()] = None
+        return values
+
+    # Logical: True, False or -1 for unknown
+    values = np.isin(raw, LOGICAL_TRUE).astype(object)
+    values[raw == LOGICAL_UNKNOWN] = -1
+    return values
+
+
+def _read_records(db, start: int, record_count: int) -> dict:
+    """Read record_count records from start one by one through dbfpy3"""
+    field_names = [field.name for field in db.header.fields]
+
+    # Preallocate a record-by-field block and copy each record's parsed
+    # field list into its row
+    data = np.empty((record_count, len(field_names)), dtype=object)
+
+    filled = 0
+    for row in range(record_count):
+        try:
+            data[row] = db[start + row].fields
+        except IndexError:
+            break
+        filled = row + 1
+
+    return {name: data[:filled, i] for i, name in enumerate(field_names)}
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DataFrame Dtype Helpers
+
+Storage conversions applied to DataFrames after they are loaded.
+"""
+
+import pandas as pd
+import logging
+
+from .optional import has_module
+
+logger = logging.getLogger(__name__)
+
+# Check for PyArrow support (compact string storage); pandas imports it
+# itself when a column is first converted
+PYARROW_SUPPORT = has_module('pyarrow')
+
+
+def use_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store text columns as PyArrow-backed strings when pyarrow is installed.
+
+    Arrow strings live in one contiguous buffer per column instead of one
+    Python object per cell, which cuts memory for text-heavy tables and
+    runs string operations in C. Columns mixing strings with other values
+    (dates, numbers) are left unchanged.
+
+    Args:
+        df: Freshly loaded DataFrame; converted in place
+
+    Returns:
+        pd.DataFrame: The same DataFrame
+    """
+    if not PYARROW_SUPPORT:
+        return df
+
+    for col in df.select_dtypes(include='object').columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
@@ -8,11 +8,12 @@ Supports Windows (ANSI/CP1252), MS-DOS (OEM/CP437), and UTF-8.
 """
 
 import os
-import shutil
 from datetime import datetime
 from tkinter import messagebox
 import logging
 
+from .files import copy_file
+
 logger = logging.getLogger(__name__)
 
 # Encoding mappings
@@ -170,7 +171,7 @@ def _create_backup(file_path: str) -> str:
     backup_name = f"{os.path.splitext(file_name)[0]}_backup_{timestamp}{os.path.splitext(file_name)[1]}"
     backup_path = os.path.join(backup_dir, backup_name)
     
-    shutil.copy2(file_path, backup_path)
+    copy_file(file_path, backup_path)
     return backup_path
 
 
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared UI Fonts
+
+Cached CustomTkinter font objects reused by every window and dialog.
+"""
+
+from functools import lru_cache
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Return a shared CTkFont for the given size and weight.
+
+    Fonts are created on first use, after the Tk root exists, and reused
+    afterwards so opening a dialog does not register new Tk fonts.
+
+    Args:
+        size: Font size in points
+        weight: "normal" or "bold"
+
+    Returns:
+        ctk.CTkFont: Cached font object
+    """
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+def title_font() -> ctk.CTkFont:
+    """Large bold font used for dialog titles"""
+    return get_font(20, "bold")
+
+
+def heading_font() -> ctk.CTkFont:
+    """Bold font used for dialog section headings"""
+    return get_font(16, "bold")
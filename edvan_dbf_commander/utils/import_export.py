@@ -12,13 +12,35 @@ import glob
 import tempfile
 from datetime import datetime, timedelta
 from tkinter import messagebox
+import numpy as np
 import pandas as pd
 from dbfpy3 import dbf
 import xml.etree.ElementTree as ET
 import logging
 
+from .dbf_writer import DBFField, write_dbf, append_dbf
+from .dtypes import PYARROW_SUPPORT
+from .optional import has_module, load_pyarrow
+
 logger = logging.getLogger(__name__)
 
+# Rows per chunk when pandas writes CSV output
+CSV_CHUNK_ROWS = 65_536
+
+# Rows formatted per chunk and output buffer size for XML export
+XML_CHUNK_ROWS = 50_000
+XML_BUFFER_SIZE = 1 << 20
+
+# Characters escaped in XML element text; '&' must come first
+XML_ENTITIES = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'))
+
+# Check for xlsxwriter (streaming Excel export); openpyxl is used otherwise
+XLSXWRITER_SUPPORT = has_module('xlsxwriter')
+
+# Rows converted per chunk and worksheet row limit for Excel export
+EXCEL_CHUNK_ROWS = 50_000
+EXCEL_MAX_ROWS = 1_048_576
+
 
 def import_csv_to_dbf(csv_path: str, dbf_path: str, 
                       delimiter: str = ',', 
@@ -139,9 +161,138 @@ def import_xml_to_dbf(xml_path: str, dbf_path: str,
         return False
 
 
+def export_dataframe_to_dbf(df: pd.DataFrame, dbf_path: str):
+    """
+    Write a DataFrame to a new DBF file, deriving field types from the data.
+    
+    Args:
+        df: Data to write
+        dbf_path: Path to the DBF file to create
+    """
+    _create_dbf_from_dataframe(_prepare_dataframe_for_dbf(df), dbf_path)
+
+
+def export_dataframe_to_csv(df: pd.DataFrame, csv_path: str):
+    """
+    Write a DataFrame to a UTF-8 CSV file with a header row.
+    
+    Rows are formatted by pandas' C writer a chunk at a time, so the
+    formatted text of the whole frame is never held in memory.
+    
+    Args:
+        df: Data to write
+        csv_path: Path to the CSV file to create
+    """
+    df.to_csv(csv_path, index=False, chunksize=CSV_CHUNK_ROWS)
+
+
+def export_dataframe_to_excel(df: pd.DataFrame, excel_path: str):
+    """
+    Write a DataFrame to an Excel workbook with a header row.
+    
+    With xlsxwriter installed, rows are streamed to the file in
+    constant-memory mode, so only the current row is held in memory;
+    otherwise pandas builds the workbook with openpyxl.
+    
+    Args:
+        df: Data to write
+        excel_path: Path to the .xlsx file to create
+    """
+    if not XLSXWRITER_SUPPORT:
+        df.to_excel(excel_path, index=False)
+        return
+    
+    if len(df) + 1 > EXCEL_MAX_ROWS:
+        raise ValueError(f"Too many rows for an Excel sheet: {len(df):,} "
+                         f"(maximum {EXCEL_MAX_ROWS - 1:,})")
+    
+    import xlsxwriter
+    workbook = xlsxwriter.Workbook(excel_path, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd'
+    })
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, [str(col) for col in df.columns],
+                            workbook.add_format({'bold': True}))
+        
+        # constant_memory mode requires rows to be written in order
+        row = 1
+        for start in range(0, len(df), EXCEL_CHUNK_ROWS):
+            chunk = df.iloc[start:start + EXCEL_CHUNK_ROWS]
+            # Missing values become None so they are left as empty cells
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            for values in chunk.itertuples(index=False, name=None):
+                worksheet.write_row(row, 0, values)
+                row += 1
+    finally:
+        workbook.close()
+
+
+def export_dataframe_to_xml(df: pd.DataFrame, xml_path: str):
+    """
+    Write a DataFrame to an XML file, one <record> element per row.
+    
+    Rows are formatted a chunk at a time, escaping whole columns with
+    vectorized string kernels, so no document tree is built in memory.
+    Missing values are written as empty elements.
+    
+    Args:
+        df: Data to write
+        xml_path: Path to the XML file to create
+    """
+    tags = [str(col).lower() for col in df.columns]
+    
+    with open(xml_path, 'w', encoding='utf-8', buffering=XML_BUFFER_SIZE) as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<data>\n')
+        for start in range(0, len(df), XML_CHUNK_ROWS):
+            chunk = df.iloc[start:start + XML_CHUNK_ROWS]
+            parts = [np.full(len(chunk), '  <record>\n', dtype=object)]
+            parts += [
+                f'    <{tag}>' + _escape_xml_column(chunk.iloc[:, i]) + f'</{tag}>\n'
+                for i, tag in enumerate(tags)
+            ]
+            parts.append(np.full(len(chunk), '  </record>\n', dtype=object))
+            # Row-major join: every element of a record, then the next record
+            f.write(''.join(np.column_stack(parts).ravel()))
+        f.write('</data>\n')
+
+
+def _escape_xml_column(values: pd.Series) -> np.ndarray:
+    """Convert a column to XML-escaped text; missing values become empty"""
+    # Arrow formats floats, booleans and dates differently from str(), so
+    # only integer and text columns take the Arrow path
+    if PYARROW_SUPPORT and _arrow_formats_like_str(values):
+        pa = load_pyarrow()
+        import pyarrow.compute as pc
+        try:
+            text = pc.cast(pa.array(values, from_pandas=True), pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # Mixed or unsupported values; format them with pandas
+        else:
+            for char, entity in XML_ENTITIES:
+                text = pc.replace_substring(text, char, entity)
+            return pc.fill_null(text, '').to_numpy(zero_copy_only=False)
+    
+    text = pd.Series(list(map(str, values.tolist())), index=values.index, dtype=object)
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        for char, entity in XML_ENTITIES:
+            text = text.str.replace(char, entity, regex=False)
+    return text.where(values.notna(), '').to_numpy(dtype=object)
+
+
+def _arrow_formats_like_str(values: pd.Series) -> bool:
+    """True if an Arrow string cast of values gives the same text as str()"""
+    if values.dtype.kind in 'iu':
+        return True
+    return (isinstance(values.dtype, pd.StringDtype)
+            or pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'))
+
+
 def _prepare_dataframe_for_dbf(df: pd.DataFrame) -> pd.DataFrame:
     """Prepare DataFrame for DBF conversion."""
-    result = df.copy()
+    # Shallow copy: columns are replaced below, never modified in place
+    result = df.copy(deep=False)
     
     # Clean column names (max 10 chars, uppercase, no special chars)
     new_columns = []
@@ -154,86 +305,64 @@ def _prepare_dataframe_for_dbf(df: pd.DataFrame) -> pd.DataFrame:
         new_columns.append(clean_name)
     result.columns = new_columns
     
-    # Handle data types
-    for col in result.columns:
-        dtype = result[col].dtype
-        
-        # Convert to string and limit length
-        if dtype == 'object':
-            result[col] = result[col].fillna('').astype(str).str[:254]
-        elif pd.api.types.is_datetime64_any_dtype(dtype):
-            result[col] = result[col].dt.strftime('%Y%m%d')
-        elif dtype == 'bool':
-            result[col] = result[col].map({True: 'T', False: 'F'})
-        elif pd.api.types.is_numeric_dtype(dtype):
-            result[col] = result[col].fillna(0)
+    # Group columns by dtype once, then convert each group as a block
+    text_cols = result.select_dtypes(include=['object', 'string']).columns
+    date_cols = result.select_dtypes(include=['datetime', 'datetimetz']).columns
+    bool_cols = result.select_dtypes(include='bool').columns
+    num_cols = result.select_dtypes(include='number').columns
+    
+    # Convert to string and limit length
+    if len(text_cols):
+        text = result[text_cols].fillna('').astype(str)
+        for col in text_cols:
+            result[col] = text[col].str.slice(0, 254)
+    
+    for col in date_cols:
+        result[col] = result[col].dt.strftime('%Y%m%d')
+    
+    if len(bool_cols):
+        result[bool_cols] = np.where(result[bool_cols].to_numpy(), 'T', 'F')
+    
+    if len(num_cols) and result[num_cols].isna().to_numpy().any():
+        result[num_cols] = result[num_cols].fillna(0)
     
     return result
 
 
 def _create_dbf_from_dataframe(df: pd.DataFrame, dbf_path: str):
     """Create a new DBF file from DataFrame."""
-    import dbf as dbf_lib
+    # Longest value per character column, measured in one pass over the block
+    text_cols = [col for col in df.columns
+                 if not pd.api.types.is_numeric_dtype(df[col].dtype)]
+    max_lens = {}
+    if text_cols and len(df):
+        text = df[text_cols].fillna('').astype(str).to_numpy(dtype=object)
+        lengths = np.frompyfunc(len, 1, 1)(text)
+        max_lens = dict(zip(text_cols, lengths.max(axis=0)))
     
     # Determine field specifications
-    field_specs = []
+    fields = []
     for col in df.columns:
         dtype = df[col].dtype
         
         if pd.api.types.is_numeric_dtype(dtype):
             if pd.api.types.is_integer_dtype(dtype):
-                field_specs.append(f"{col} N(12,0)")
+                fields.append(DBFField(col, 'N', 12, 0))
             else:
-                field_specs.append(f"{col} N(12,2)")
+                fields.append(DBFField(col, 'N', 12, 2))
         else:
-            max_len = min(df[col].astype(str).str.len().max() or 10, 254)
+            max_len = min(int(max_lens.get(col, 0)) or 10, 254)
             max_len = max(max_len, 1)
-            field_specs.append(f"{col} C({max_len})")
+            fields.append(DBFField(col, 'C', max_len))
     
-    # Create table
-    table = dbf_lib.Table(dbf_path, '; '.join(field_specs))
-    table.open(mode=dbf_lib.READ_WRITE)
-    
-    try:
-        for _, row in df.iterrows():
-            record = table.new()
-            for i, (col, value) in enumerate(row.items()):
-                field_name = list(table.field_names)[i]
-                if pd.isna(value) or value == '':
-                    setattr(record, field_name, '')
-                else:
-                    setattr(record, field_name, value)
-            record.write_record()
-    finally:
-        table.close()
+    # Format all records up front and write the file in one go
+    write_dbf(df, dbf_path, fields)
 
 
 def _append_to_dbf(df: pd.DataFrame, dbf_path: str):
     """Append DataFrame records to existing DBF file."""
-    import dbf as dbf_lib
-    
-    table = dbf_lib.Table(dbf_path)
-    table.open(mode=dbf_lib.READ_WRITE)
-    
-    try:
-        for _, row in df.iterrows():
-            record = table.new()
-            for col, value in row.items():
-                # Find matching field name (case-insensitive)
-                matching_field = None
-                for field in table.field_names:
-                    if field.upper() == col.upper():
-                        matching_field = field
-                        break
-                
-                if matching_field:
-                    if pd.isna(value) or value == '':
-                        setattr(record, matching_field, '')
-                    else:
-                        setattr(record, matching_field, value)
-            record.write_record()
-    finally:
-        table.close()
+    # Columns are matched to fields by name; all rows are written at once
+    append_dbf(df, dbf_path)
 
 
 def cleanup_temp_files(max_age_hours: int = 24):
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Optional Dependency Loading
+
+Availability checks and on-demand imports for optional packages, so
+modules can tell whether a feature is available without paying its
+import cost at startup.
+"""
+
+from functools import lru_cache
+from importlib.util import find_spec
+
+
+def has_module(name: str) -> bool:
+    """Whether a package is installed, without importing it"""
+    return find_spec(name) is not None
+
+
+@lru_cache(maxsize=None)
+def load_pyreadstat():
+    """Import pyreadstat on first use and return the module"""
+    import pyreadstat
+    return pyreadstat
+
+
+@lru_cache(maxsize=None)
+def load_pyarrow():
+    """Import pyarrow on first use and return the module"""
+    import pyarrow
+    return pyarrow
+
+
+@lru_cache(maxsize=None)
+def load_duckdb():
+    """Import duckdb on first use and return the module"""
+    import duckdb
+    return duckdb